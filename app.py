@@ -1,189 +1,73 @@
 import streamlit as st
-import fitz
-import re
 import os
-import json
-import zipfile
-import random
 import time
-import qrcode
-from io import BytesIO
-from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+import uuid
+import threading
+
+from resume2portfolio import (
+    THEMES, ROLES, RANDOM_THEME, ExtractionCache, OcrEngine, ocr_available, JobQueue, JobLimitError, cache_key,
+    AdmissionController, AdmissionError, UploadRejected,
+    PAGE_CACHE_NAMESPACE, PAGE_CACHE_ENTRIES, PAGE_CACHE_DISK_BUDGET,
+    generation_job, portfolio_url, qr_png, qr_svg, warm_up, METRICS, serve_metrics, ArtifactStore, minify_html,
+)
 
 # ---------- Phase 1: Configuration & Setup ----------
 st.set_page_config(page_title="Resume2PortfolioAI Pro", page_icon="🧠", layout="wide")
 
 # ---------- Phase 2: Themes & Constants ----------
-THEMES = [
-    {"name":"Aurora Pro","bg":"#0b1220","card":"rgba(255,255,255,0.06)","text":"#e5e7eb",
-     "accent1":"#2563eb","accent2":"#a855f7","accent3":"#ec4899","font_heading":"Poppins","font_body":"Inter"},
-    {"name":"Sunset Studio","bg":"#120a0a","card":"rgba(255,255,255,0.08)","text":"#fff7ed",
-     "accent1":"#f97316","accent2":"#fb7185","accent3":"#f59e0b","font_heading":"Montserrat","font_body":"Nunito"},
-    {"name":"Emerald Glass","bg":"#04120d","card":"rgba(255,255,255,0.07)","text":"#ecfdf5",
-     "accent1":"#22c55e","accent2":"#06b6d4","accent3":"#10b981","font_heading":"Space Grotesk","font_body":"DM Sans"},
-    {"name":"Mono Minimal","bg":"#070707","card":"rgba(255,255,255,0.07)","text":"#f4f4f5",
-     "accent1":"#ffffff","accent2":"#a1a1aa","accent3":"#71717a","font_heading":"IBM Plex Sans","font_body":"IBM Plex Sans"},
-    {"name":"Oceanic Depth","bg":"#0f172a","card":"rgba(255,255,255,0.05)","text":"#f1f5f9",
-     "accent1":"#38bdf8","accent2":"#818cf8","accent3":"#6366f1","font_heading":"Outfit","font_body":"Roboto"}
-]
-
-# ---------- Phase 3: Backend Custom Logic (Unchanged) ----------
-def extract_pdf_text(file):
-    doc = fitz.open(stream=file.read(), filetype="pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
-
-def find_email(text):
-    m = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
-    return m[0] if m else ""
-
-def find_phone(text):
-    m = re.findall(r"(\+?\d[\d -]{8,}\d)", text)
-    return m[0] if m else ""
-
-def find_linkedin(text):
-    m = re.findall(r"(https?://(www\.)?linkedin\.com/[^\s]+)", text)
-    return m[0][0] if m else ""
-
-def find_github(text):
-    m = re.findall(r"(https?://(www\.)?github\.com/[^\s]+)", text)
-    return m[0][0] if m else ""
-
-def guess_name(text):
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
-    if not lines: return "Your Name"
-    c = lines[0]
-    if "@" in c or "linkedin" in c.lower() or "github" in c.lower():
-        return lines[1] if len(lines)>1 else "Your Name"
-    return c[:40]
-
-def extract_skills(text):
-    common = ["python","java","c++","c","sql","mysql","mongodb","firebase","machine learning","deep learning","nlp",
-              "opencv","tensorflow","pytorch","html","css","javascript","react","node","express","php","flutter",
-              "aws","docker","kubernetes","git","github","power bi","tableau"]
-    t = text.lower()
-    found = [s.title() for s in common if s in t]
-    return sorted(list(set(found)))
-
-def extract_education(text):
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
-    edu=[]
-    for l in lines:
-        if any(x in l.lower() for x in ["b.tech","btech","diploma","ssc","hsc","university","college","bachelor","master","phd"]):
-            edu.append(l)
-    return edu[:4] if edu else []
-
-def extract_certifications(text):
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
-    certs = []
-    keywords = ["certified", "certification", "certificate", "licence", "award"]
-    for l in lines:
-        if any(k in l.lower() for k in keywords):
-            if len(l) < 100:
-                certs.append(l)
-    return certs[:5] if certs else []
-
-def extract_projects(text):
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
-    lower = text.lower()
-    if "project" not in lower: return []
-    start=None
-    for i,l in enumerate(lines):
-        if "project" in l.lower():
-            start=i; break
-    if start is None: return []
-    chunk=lines[start:start+35]
-    projects=[]
-    for l in chunk:
-        if "project" in l.lower(): continue
-        if 6 < len(l) < 80 and len(projects)<4:
-            projects.append({"name":l,"desc":"Project description extracted from resume.","tech":""})
-    return projects
-
-def generate_simple_faq(data):
-    """
-    Generates a simple FAQ list based on extracted data.
-    """
-    name = data.get('name', 'The Candidate')
-    skills = ", ".join(data.get('skills', [])[:5])
-    
-    faq = [
-        ("What are your top skills?", f"My core technical strengths include {skills}."),
-        ("Do you have project experience?", f"Yes! I have worked on projects like '{data.get('projects', [{}])[0].get('name', 'various projects')}'. Check the Projects section for more."),
-        ("How can I contact you?", f"You can reach me via email at {data.get('email', 'provided in contact section')}."),
-        ("What is your educational background?", f"I studied {data.get('education', ['Computer Science'])[0]}.")
-    ]
-    return faq
-
-def generate_css(theme):
-    return f"""
-/* Generated by Resume2PortfolioAI Pro */
-:root {{
-    --bg-color: {theme['bg']};
-    --card-bg: {theme['card']};
-    --text-color: {theme['text']};
-    --accent-1: {theme['accent1']};
-    --accent-2: {theme['accent2']};
-    --accent-3: {theme['accent3']};
-    --font-heading: '{theme['font_heading']}', sans-serif;
-    --font-body: '{theme['font_body']}', sans-serif;
-}}
-/* ... (Rest of CSS logic is handled in template, simplified here for brevity) ... */
-body {{ background-color: var(--bg-color); color: var(--text-color); font-family: var(--font-body); }}
-h1, h2, h3 {{ font-family: var(--font-heading); }}
-"""
-
-def build_portfolio(output_dir, data, pdf_buffer=None):
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("index.html")
-    
-    # Add FAQ data for template
-    data['faq'] = generate_simple_faq(data)
-    
-    html = template.render(**data)
-
-    os.makedirs(output_dir, exist_ok=True)
-
-    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
-        f.write(html)
-
-    with open(os.path.join(output_dir, "style.css"), "w", encoding="utf-8") as f:
-        f.write(generate_css(data["theme"]))
-
-    if pdf_buffer:
-        with open(os.path.join(output_dir, "resume.pdf"), "wb") as f:
-            f.write(pdf_buffer.getbuffer())
-
-    with open(os.path.join(output_dir, "data.json"), "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-
-def zip_folder(folder_path, zip_path):
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, folder_path)
-                zf.write(full_path, arcname=rel_path)
-
-def generate_qr_code(url):
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    return img
+# ---------- Phase 3: Backend Custom Logic ----------
+# Themes and the extraction/build pipeline live in the resume2portfolio package
+# so the batch CLI (python -m resume2portfolio batch ...) can share them.
+
+@st.cache_resource
+def get_extraction_cache():
+    # Shared across sessions: re-generating or switching theme on the same PDF skips PyMuPDF entirely.
+    cache = ExtractionCache(disk_dir=os.environ.get("R2P_CACHE_DIR"))
+    # Scanned resumes: OCR image-only pages when Tesseract is available (R2P_OCR=0 disables)
+    if os.environ.get("R2P_OCR", "1") != "0" and ocr_available():
+        pages = cache.namespace(PAGE_CACHE_NAMESPACE, PAGE_CACHE_ENTRIES, PAGE_CACHE_DISK_BUDGET)
+        cache.ocr = OcrEngine(max_workers=int(os.environ.get("R2P_OCR_WORKERS", "2")), cache=pages)
+    return cache
+
+@st.cache_resource
+def get_job_queue():
+    # Process-wide worker pool so generation never runs on the Streamlit script thread.
+    return JobQueue(max_workers=int(os.environ.get("R2P_WORKERS", "2")))
+
+@st.cache_resource
+def get_admission():
+    # Per-session and global token buckets, a concurrency semaphore and a cheap PDF precheck in front
+    # of the queue (R2P_SESSION_RATE/_BURST, R2P_GLOBAL_RATE/_BURST, R2P_MAX_CONCURRENT, R2P_MAX_WAITING).
+    max_concurrent = os.environ.get("R2P_MAX_CONCURRENT")
+    return AdmissionController(get_job_queue(), max_concurrent=int(max_concurrent) if max_concurrent else None)
+
+@st.cache_resource
+def get_artifact_store():
+    # Generated sites live under unique build ids with a size/age budget (R2P_ARTIFACT_DIR,
+    # R2P_ARTIFACT_BUDGET, R2P_ARTIFACT_MAX_AGE) instead of accumulating in the working directory.
+    return ArtifactStore()
+
+@st.cache_resource
+def start_warm_up():
+    # PyMuPDF, Jinja2, qrcode/PIL and NumPy are imported lazily; load them (and compile the templates)
+    # in the background while the first visitor is still on the upload screen.
+    thread = threading.Thread(target=warm_up, name="r2p-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_data
+def theme_options():
+    return [RANDOM_THEME] + [t.name for t in THEMES]
+
+@st.cache_resource
+def init_metrics_endpoint():
+    # Prometheus text on /metrics and JSON on /metrics.json when R2P_METRICS_PORT is set
+    port = os.environ.get("R2P_METRICS_PORT")
+    return serve_metrics(int(port)) if port else None
 
 # ---------- Phase 4: Premium UI Components ----------
 
-def render_custom_css():
-    st.markdown("""
+UI_CSS = """
     <style>
         /* Main Gradient Background */
         .stApp {
@@ -261,7 +145,15 @@ def render_custom_css():
             border-top: 1px solid rgba(255,255,255,0.05);
         }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+@st.cache_data
+def load_ui_css():
+    # Minified once per process; Streamlit still needs it emitted on every rerun, but smaller.
+    return minify_html(UI_CSS)
+
+def render_custom_css():
+    st.markdown(load_ui_css(), unsafe_allow_html=True)
 
 def render_header():
     st.markdown("""
@@ -289,12 +181,10 @@ def render_sidebar():
         resume_pdf = st.file_uploader("1️⃣ Upload Resume (PDF)", type=["pdf"], help="Select your standard PDF resume.")
         
         st.write("")
-        theme_choice = st.selectbox("2️⃣ Select Theme", ["Random (Auto)"] + [t["name"] for t in THEMES], help="Choose a visual style for your portfolio.")
+        theme_choice = st.selectbox("2️⃣ Select Theme", theme_options(), help="Choose a visual style for your portfolio.")
         
         st.write("")
-        role = st.selectbox("3️⃣ Your Role Tagline", 
-                           ["AI/ML Developer", "Data Analyst", "Full Stack Developer", "Backend Engineer", 
-                            "Frontend Developer", "Cloud/DevOps Engineer", "Software Engineer"],
+        role = st.selectbox("3️⃣ Your Role Tagline", ROLES,
                            help="This will be the main title of your portfolio.")
         
         st.divider()
@@ -327,7 +217,7 @@ def render_onboarding():
     
     st.info("👈 Please start by uploading your resume in the sidebar!")
 
-def render_chat_assistant(data, text_content):
+def render_chat_assistant(data, resume_index):
     st.write("")
     st.markdown("### 💬 Ask About Me (AI Assistant)")
     st.caption("Ask questions about the candidate based on the uploaded resume.")
@@ -365,38 +255,48 @@ def render_chat_assistant(data, text_content):
         p_lower = prompt.lower()
         
         if "project" in p_lower:
-            projs = data.get("projects", [])
+            projs = data.projects
             if projs:
-                response = f"My best project is likely **{projs[0]['name']}**. Description: {projs[0]['desc']}"
+                response = f"My best project is likely **{projs[0].name}**. Description: {projs[0].desc}"
             else:
                 response = "I did not find detailed projects in the resume text."
         elif "skill" in p_lower:
-            skills = ", ".join(data.get("skills", [])[:10])
+            skills = ", ".join(data.skills[:10])
             response = f"My top technical skills include: **{skills}**."
         elif "hire" in p_lower or "suitable" in p_lower:
-            response = f"I have experience with {', '.join(data.get('skills', [])[:3])} and a background in {data.get('education', ['tech'])[0]}. I am passionate about building software."
+            response = f"I have experience with {', '.join(data.skills[:3])} and a background in {data.education[0] if data.education else 'tech'}. I am passionate about building software."
         elif "intro" in p_lower:
-            response = f"Hi! I am {data['name']}, a {data['title'].split('|')[0]} proficient in {', '.join(data.get('skills', [])[:3])}. I have worked on {len(data['projects'])} key projects."
+            response = f"Hi! I am {data.name}, a {data.title.split('|')[0]} proficient in {', '.join(data.skills[:3])}. I have worked on {len(data.projects)} key projects."
         else:
-            # General Search
-            matches = [line for line in text_content.split('\n') if any(word in line.lower() for word in p_lower.split())]
+            # General Search (BM25 over resume lines, built once at extraction time)
+            matches = resume_index.search(prompt, k=3)
             if matches:
-                 response = "Based on the resume: " + matches[0]
+                response = "Based on the resume:\n" + "\n".join(f"- {line}" for _, line in matches)
 
         with st.chat_message("assistant"):
             st.markdown(response)
         st.session_state.messages.append({"role": "assistant", "content": response})
 
-def render_dashboard(data, output_dir, zip_path, resume_text):
+def render_dashboard(data, artifacts, build_id, resume_index, stages=None):
+    store = get_artifact_store()
+    files = store.files(build_id)
     st.divider()
     st.markdown("## 📊 Portfolio Dashboard")
     
     # KPI Cards
     k1, k2, k3, k4 = st.columns(4)
-    k1.metric("🎨 Theme", data['theme']['name'])
-    k2.metric("💡 Skills Found", len(data['skills']))
-    k3.metric("📂 Projects", len(data['projects']))
-    k4.metric("🔗 Links", sum(1 for x in [data['linkedin'], data['github'], data['email']] if x))
+    k1.metric("🎨 Theme", data.theme.name)
+    k2.metric("💡 Skills Found", len(data.skills))
+    k3.metric("📂 Projects", len(data.projects))
+    k4.metric("🔗 Links", sum(1 for x in [data.linkedin, data.github, data.email] if x))
+
+    # Timing breakdown for this generation
+    if stages:
+        cols = st.columns(len(stages))
+        for col, (stage, rec) in zip(cols, stages.items()):
+            col.metric(f"⏱️ {stage}", f"{rec['wall'] * 1000:.1f} ms", help=f"CPU {rec['cpu'] * 1000:.1f} ms · {rec['bytes']:,} B")
+        with st.expander("Pipeline metrics (all requests)"):
+            st.code(METRICS.to_prometheus(), language="text")
 
     # Tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["👁️ Live Preview", "� Ask About Me", "�📝 Extracted Data", "📂 Generated Files", "☁️ Deploy Guide"])
@@ -405,28 +305,25 @@ def render_dashboard(data, output_dir, zip_path, resume_text):
         st.subheader("Website Preview (index.html)")
         st.caption("This is a raw code preview of the generated HTML structure.")
         try:
-            with open(os.path.join(output_dir, "index.html"), "r", encoding="utf-8") as f:
-                html_content = f.read()
-                preview_lines = "\n".join(html_content.split("\n")[:400])
-                st.code(preview_lines, language="html")
+            html_content = artifacts["index.html"][1].decode("utf-8")
+            preview_lines = "\n".join(html_content.split("\n")[:400])
+            st.code(preview_lines, language="html")
         except Exception as e:
             st.error(f"Could not load preview: {e}")
 
     with tab2:
-        render_chat_assistant(data, resume_text)
+        render_chat_assistant(data, resume_index)
 
     with tab3:
         st.subheader("Structured Data Profile")
-        st.json(data)
+        # data.json was already serialised during the build; reuse it rather than re-encoding each rerun
+        st.json(artifacts["data.json"][1].decode("utf-8"))
     
     with tab4:
         st.subheader("File Structure")
         files_data = []
-        for root, _, files in os.walk(output_dir):
-            for file in files:
-                full_path = os.path.join(root, file)
-                size = os.path.getsize(full_path)
-                files_data.append({"File Name": file, "Size (Bytes)": f"{size:,} B", "Type": file.split('.')[-1].upper()})
+        for file, size in (files or {}).items():
+            files_data.append({"File Name": file, "Size (Bytes)": f"{size:,} B", "Type": file.split('.')[-1].upper()})
         
         st.dataframe(files_data, use_container_width=True)
 
@@ -459,16 +356,13 @@ git push -u origin main
         # QR Code Section
         st.divider()
         st.subheader("📌 Portfolio QR Code")
-        user_github = data['github'] if "github.com" in data['github'] else "github.com/username"
-        repo_url = user_github if "http" in user_github else f"https://{user_github}"
+        repo_url = portfolio_url(data)
         
-        if "github.com" not in data['github']:
+        if "github.com" not in data.github:
              st.warning("⚠️ No GitHub link found in resume. Using placeholder for QR.")
         
-        qr_img = generate_qr_code(repo_url)
-        buf = BytesIO()
-        qr_img.save(buf, format="PNG")
-        byte_im = buf.getvalue()
+        # Cached per URL, so chat and tab reruns don't re-encode the image
+        byte_im = qr_png(repo_url)
         
         col_qr, col_info = st.columns([1, 4])
         with col_qr:
@@ -476,6 +370,7 @@ git push -u origin main
         with col_info:
             st.success(f"QR Code generated for: {repo_url}")
             st.download_button("⬇️ Download QR Code", byte_im, "portfolio_qr.png", "image/png")
+            st.download_button("⬇️ Download QR Code (SVG)", qr_svg(repo_url), "portfolio_qr.svg", "image/svg+xml")
         
     # Verification Checklist & Download
     st.divider()
@@ -483,75 +378,106 @@ git push -u origin main
     with c1:
         st.markdown("#### ✅ Verification Checklist")
         st.markdown("- [x] Resume Extracted")
-        st.markdown(f"- [x] Applied Theme: **{data['theme']['name']}**")
+        st.markdown(f"- [x] Applied Theme: **{data.theme.name}**")
         st.markdown("- [x] HTML & CSS Generated")
         st.markdown("- [x] ZIP Package Ready")
     
     with c2:
+        zip_bytes = store.read(build_id)
+        if zip_bytes is None:
+            st.warning("This build has expired from the server. Click Generate to rebuild it.")
+            return
         st.success("Ready for Download!")
-        with open(zip_path, "rb") as f:
-            st.download_button("📦 Download Final ZIP", f, file_name=f"portfolio_{data['name'].replace(' ', '_').lower()}.zip", mime="application/zip", type="primary", use_container_width=True)
+        st.download_button("📦 Download Final ZIP", zip_bytes, file_name=f"portfolio_{data.name.replace(' ', '_').lower()}.zip", mime="application/zip", type="primary", use_container_width=True)
 
 # ---------- Phase 5: Main Orchestration ----------
+def upload_key(resume_pdf):
+    # Hash each upload once: reruns (chat messages, tab clicks) recognise it by its file_id
+    upload = st.session_state.get("upload")
+    if upload is None or upload["file_id"] != resume_pdf.file_id:
+        upload = st.session_state.upload = {"file_id": resume_pdf.file_id, "key": cache_key(resume_pdf.getvalue())}
+    return upload["key"]
+
+def wait_for_job(job, admission):
+    # The job runs on the worker pool; this only mirrors its real stage progress.
+    # If the session goes away the job stops being touched and the queue cancels it.
+    progress_bar = st.progress(job.progress, text="Starting AI engine...")
+    while not job.done:
+        job.touch()
+        position = admission.position(job)
+        text = f"⏳ You're #{position} in line, starting shortly..." if position else job.stage
+        progress_bar.progress(job.progress, text=text)
+        time.sleep(0.05)
+    progress_bar.empty()
+
 def main():
+    start_warm_up()
+    init_metrics_endpoint()
     render_custom_css()
     render_header()
     
     resume_pdf, theme_choice, role, generate_click = render_sidebar()
+    session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+    queue = get_job_queue()
+    admission = get_admission()
+
+    # The last build for this upload is kept so theme/role changes re-render incrementally
+    pdf_key = upload_key(resume_pdf) if resume_pdf else None
+    build = st.session_state.get("build")
+    same_upload = bool(build) and build["key"] == pdf_key
+    settings_changed = same_upload and (build["theme_choice"], build["role"]) != (theme_choice, role)
+    # Settings are re-rendered automatically once: not again while that job is pending (other reruns,
+    # like chat messages, would restart it) nor after it failed or was turned away. Generate always retries.
+    settings = (pdf_key, theme_choice, role)
+    if not settings_changed:
+        st.session_state.pop("attempted", None)
+    auto_render = settings_changed and st.session_state.get("attempted") != settings
+
+    if resume_pdf and (generate_click or auto_render):
+        st.session_state.attempted = settings
+        try:
+            # Re-rendering the same upload skips extraction, so it costs a fraction of a full generation
+            pdf_bytes = resume_pdf.getvalue()
+            job = admission.submit(session_id, pdf_bytes, generation_job, get_extraction_cache(), pdf_bytes,
+                                   theme_choice, role, build["artifacts"] if same_upload else None,
+                                   store=get_artifact_store(), pdf_key=pdf_key,
+                                   cost=0.25 if same_upload else 1.0, upload_key=pdf_key, supersede=True)
+            st.session_state.pending = {"job_id": job.id, "key": pdf_key, "theme_choice": theme_choice, "role": role}
+        except UploadRejected as e:
+            st.error(str(e))
+        except AdmissionError as e:
+            st.warning(str(e))
+        except JobLimitError:
+            st.warning("A portfolio is already being generated for this session. Please wait a moment.")
+
+    pending = st.session_state.get("pending")
+    job = queue.get(pending["job_id"]) if pending else None
+    if pending and (job is None or pending["key"] != pdf_key):
+        # Job was pruned, or the upload changed underneath it
+        if job:
+            job.cancel()
+            queue.release(job.id)
+        del st.session_state["pending"]
+        job = None
+    if job:
+        wait_for_job(job, admission)
+        # The result moves into session state; the queue should not pin it as well
+        queue.release(job.id)
+        del st.session_state["pending"]
+        if job.status == "done":
+            if build:
+                # The session only ever shows its latest build
+                get_artifact_store().delete(build["build_id"])
+            build = dict(job.result, key=pending["key"], theme_choice=pending["theme_choice"], role=pending["role"])
+            st.session_state.build = build
+            same_upload = True
+        elif job.status == "failed":
+            st.error(f"Could not process this resume: {job.error}")
+        else:
+            st.warning("Generation was cancelled.")
 
-    if generate_click and resume_pdf:
-        # Progress UI
-        progress_bar = st.progress(0, text="Starting AI engine...")
-        
-        # Step 1: Extraction
-        time.sleep(0.5)
-        progress_bar.progress(25, text="📄 Extracting resume data...")
-        text = extract_pdf_text(resume_pdf)
-        
-        # Logic
-        theme = random.choice(THEMES) if theme_choice == "Random (Auto)" else [t for t in THEMES if t["name"] == theme_choice][0]
-        name = guess_name(text)
-        email = find_email(text)
-        phone = find_phone(text)
-        linkedin = find_linkedin(text)
-        github = find_github(text)
-        skills = extract_skills(text)
-        projects = extract_projects(text)
-        education = extract_education(text)
-        certifications = extract_certifications(text)
-        
-        progress_bar.progress(50, text="🧠 Analyzing skills and projects...")
-        
-        data = {
-            "name": name,
-            "title": f"{role} | Portfolio",
-            "summary": "Professional portfolio generated using Resume2PortfolioAI Pro.",
-            "email": email, "phone": phone, "linkedin": linkedin, "github": github,
-            "skills": skills if skills else ["Python", "Machine Learning", "SQL", "GitHub"],
-            "projects": projects if projects else [{"name":"Portfolio Project","desc":"Generated project.","tech":"Python"}],
-            "education": education if education else ["University Degree"],
-            "certifications": certifications if certifications else ["Certified Developer"],
-            "theme": theme,
-            "font_heading": theme["font_heading"].replace(" ", "+"),
-            "font_body": theme["font_body"].replace(" ", "+"),
-            "has_resume": True
-        }
-        
-        progress_bar.progress(75, text="🎨 Applying premium theme & building HTML...")
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        out_dir = f"generated_portfolio_{timestamp}"
-        build_portfolio(out_dir, data, resume_pdf)
-        
-        zip_path = f"{out_dir}.zip"
-        zip_folder(out_dir, zip_path)
-        
-        progress_bar.progress(100, text="✅ Done! Portfolio ready.")
-        time.sleep(0.5)
-        progress_bar.empty()
-        
-        # Render Result
-        render_dashboard(data, out_dir, zip_path, text)
+    if same_upload:
+        render_dashboard(build["data"], build["artifacts"], build["build_id"], build["index"], build.get("stages"))
         
     else:
         render_onboarding()
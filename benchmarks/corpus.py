@@ -0,0 +1,90 @@
+import random
+import fitz
+
+from resume2portfolio.taxonomy import load_taxonomy
+
+# ---------- Synthetic Resume Corpus ----------
+SKILLS = [s.name for s in load_taxonomy()]
+FIRST_NAMES = ["Aarav", "Priya", "Jordan", "Mei", "Lucas", "Fatima", "Noah", "Ananya", "Elena", "Kenji"]
+LAST_NAMES = ["Sharma", "Patel", "Nguyen", "Garcia", "Okafor", "Kim", "Rossi", "Dange", "Smith", "Silva"]
+FILLER = ("designed built optimised deployed scalable services pipelines dashboards reduced latency improved "
+          "throughput collaborated with cross functional teams delivered features mentored engineers automated "
+          "testing monitoring analytics customers stakeholders data models api backend frontend cloud").split()
+DEGREES = ["B.Tech in Computer Engineering, Pune University", "Master of Science, Stanford University",
+           "Diploma in Information Technology", "HSC, Fergusson College", "Bachelor of Engineering, IIT Bombay"]
+CERTS = ["AWS Certified Solutions Architect", "Google Data Analytics Certificate",
+         "TensorFlow Developer Certification", "Best Paper Award, ICML Workshop"]
+LAYOUTS = ["single", "two_column", "skills_last"]
+
+PAGE_RECT = fitz.Rect(0, 0, 595, 842)  # A4 in points
+
+def _paragraph(rng, words):
+    return " ".join(rng.choice(FILLER) for _ in range(words)).capitalize() + "."
+
+def resume_sections(rng, skills=12, density=120):
+    """
+    Returns (header lines, {section title: lines}) for one synthetic candidate.
+    density is roughly the number of filler words in the experience section per page.
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first}{last}".lower()
+    header = [f"{first} {last}",
+              f"{handle}@example.com",
+              f"+91 98{rng.randint(10000000, 99999999)}",
+              f"https://www.linkedin.com/in/{handle}",
+              f"https://github.com/{handle}"]
+    sections = {
+        "Skills": [", ".join(rng.sample(SKILLS, min(skills, len(SKILLS))))],
+        "Projects": [f"{rng.choice(FILLER).title()} {rng.choice(FILLER).title()} Platform" for _ in range(4)],
+        "Education": rng.sample(DEGREES, 2),
+        "Certifications": rng.sample(CERTS, 2),
+        "Experience": [_paragraph(rng, 25) for _ in range(max(1, density // 25))],
+    }
+    return header, sections
+
+def make_resume_pdf(seed=0, pages=1, skills=12, density=120, layout="single"):
+    """
+    Builds one synthetic resume PDF in memory and returns its bytes.
+    """
+    rng = random.Random(seed)
+    header, sections = resume_sections(rng, skills, density)
+    order = list(sections)
+    if layout == "skills_last":
+        order.remove("Skills")
+        order.append("Skills")
+
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page(width=PAGE_RECT.width, height=PAGE_RECT.height)
+        blocks = [(header[0], 16), ("\n".join(header[1:]), 9)] if p == 0 else []
+        for title in (order if p == 0 else ["Experience"]):
+            blocks.append((title.upper(), 12))
+            blocks.append(("\n".join(sections[title]), 9))
+
+        if layout == "two_column":
+            columns = [fitz.Rect(36, 36, 290, 806), fitz.Rect(305, 36, 559, 806)]
+            half = (len(blocks) + 1) // 2
+            parts = [blocks[:half], blocks[half:]]
+        else:
+            columns = [fitz.Rect(36, 36, 559, 806)]
+            parts = [blocks]
+        for rect, part in zip(columns, parts):
+            y = rect.y0
+            for text, size in part:
+                box = fitz.Rect(rect.x0, y, rect.x1, rect.y1)
+                fontname = "hebo" if size >= 12 else "helv"
+                left = page.insert_textbox(box, text, fontsize=size, fontname=fontname)
+                used = box.height - left if left >= 0 else box.height
+                y = min(rect.y1, y + used + 6)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def make_corpus(size, seed=0, pages=(1, 2), skills=(5, 25), density=(60, 400), layouts=LAYOUTS):
+    """
+    Yields `size` PDFs as bytes with page count, skill count, text density and layout varied per resume.
+    """
+    rng = random.Random(seed)
+    for i in range(size):
+        yield make_resume_pdf(seed=seed * 100003 + i, pages=rng.randint(*pages), skills=rng.randint(*skills),
+                              density=rng.randint(*density), layout=rng.choice(layouts))
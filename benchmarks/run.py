@@ -0,0 +1,109 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from io import BytesIO
+
+from resume2portfolio import extract
+from resume2portfolio.layout import segment
+from resume2portfolio.portfolio import THEMES, profile_from_fields, build_portfolio, zip_folder
+from .corpus import make_corpus
+
+EXTRACTORS = ["find_email", "find_phone", "find_linkedin", "find_github", "guess_name", "extract_skills",
+              "extract_education", "extract_certifications", "extract_projects", "extract_fields"]
+
+# ---------- Benchmark Runner ----------
+def _best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_corpus(pdfs, repeat=3):
+    """
+    Times every pipeline stage over one corpus; returns {benchmark name: best total seconds}.
+    """
+    results = {}
+    results["extract_pdf_text"] = _best_of(repeat, lambda: [extract.extract_pdf_text(p) for p in pdfs])
+    texts = [extract.extract_pdf_text(p) for p in pdfs]
+    results["extract_pdf_lines"] = _best_of(repeat, lambda: [extract.extract_pdf_lines(p) for p in pdfs])
+    pages = [extract.extract_pdf_lines(p) for p in pdfs]
+    results["segment"] = _best_of(repeat, lambda: [segment(lines) for lines in pages])
+    for name in EXTRACTORS:
+        fn = getattr(extract, name)
+        results[name] = _best_of(repeat, lambda: [fn(t) for t in texts])
+
+    profiles = [profile_from_fields(extract.extract_fields(t), "Software Engineer", THEMES[i % len(THEMES)])
+                for i, t in enumerate(texts)]
+    root = tempfile.mkdtemp(prefix="r2p-bench-")
+    try:
+        dirs = [os.path.join(root, str(i)) for i in range(len(pdfs))]
+        results["build_portfolio"] = _best_of(repeat, lambda: [
+            build_portfolio(d, data, BytesIO(pdf)) for d, data, pdf in zip(dirs, profiles, pdfs)])
+        results["zip_folder"] = _best_of(repeat, lambda: [zip_folder(d, f"{d}.zip") for d in dirs])
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+def run(sizes, repeat=3, seed=0):
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                       "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat, "seed": seed},
+              "results": {}}
+    for size in sizes:
+        pdfs = list(make_corpus(size, seed=seed))
+        for name, seconds in bench_corpus(pdfs, repeat).items():
+            report["results"][f"{name}@{size}"] = {"seconds": seconds, "per_item": seconds / size, "n": size}
+    return report
+
+def compare(current, baseline, threshold=0.2):
+    """
+    Returns [(benchmark, baseline per-item, current per-item, ratio)] for every benchmark that got
+    more than `threshold` slower than the saved baseline.
+    """
+    slower = []
+    for key, cur in current["results"].items():
+        base = baseline["results"].get(key)
+        if not base or not base["per_item"]:
+            continue
+        ratio = cur["per_item"] / base["per_item"]
+        if ratio > 1 + threshold:
+            slower.append((key, base["per_item"], cur["per_item"], ratio))
+    return slower
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmark the resume pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200], help="Corpus sizes to benchmark.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best one is kept.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results JSON here (default: stdout).")
+    parser.add_argument("--baseline", default=None, help="Compare against a previously saved results JSON.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.seed)
+    payload = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        slower = compare(report, baseline, args.threshold)
+        for key, base, cur, ratio in slower:
+            print(f"SLOWER {key}: {base * 1000:.3f} ms -> {cur * 1000:.3f} ms per item ({ratio:.2f}x)", file=sys.stderr)
+        if slower:
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import sys
+import json
+import argparse
+import platform
+import statistics
+import subprocess
+
+# ---------- Startup / Import-Time Report ----------
+# Each probe runs in a fresh interpreter so nothing is already imported.
+PROBES = {
+    "import_package": (
+        "import time; t = time.perf_counter(); import resume2portfolio as r; "
+        "print(json.dumps({'seconds': time.perf_counter() - t, 'heavy': r.loaded_heavy_modules()}))"),
+    "import_package_eager": (
+        "import time; t = time.perf_counter(); import resume2portfolio as r; "
+        "import fitz, qrcode, PIL.Image, jinja2, numpy; "
+        "print(json.dumps({'seconds': time.perf_counter() - t, 'heavy': r.loaded_heavy_modules()}))"),
+    "warm_up": (
+        "import time; import resume2portfolio as r; t = time.perf_counter(); steps = r.warm_up(); "
+        "print(json.dumps({'seconds': time.perf_counter() - t, 'steps': steps}))"),
+}
+
+def _probe(code):
+    out = subprocess.run([sys.executable, "-c", f"import json; {code}"], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def run(repeat=5):
+    """
+    Times each probe `repeat` times in new processes; reports the median and the last run's details.
+    """
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(), "repeat": repeat},
+              "results": {}}
+    for name, code in PROBES.items():
+        runs = [_probe(code) for _ in range(repeat)]
+        result = dict(runs[-1])
+        result["seconds"] = statistics.median(r["seconds"] for r in runs)
+        report["results"][name] = result
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup",
+                                      description="Measure package import time and warm-up cost.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh-process runs per probe; the median is kept.")
+    parser.add_argument("--out", default=None, help="Write results JSON here (default: stdout).")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat)
+    payload = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    results = report["results"]
+    lazy, eager = results["import_package"]["seconds"], results["import_package_eager"]["seconds"]
+    print(f"import resume2portfolio: {lazy * 1000:.1f} ms (loads {results['import_package']['heavy'] or 'no heavy modules'}); "
+          f"with every heavy dependency: {eager * 1000:.1f} ms; deferred: {(eager - lazy) * 1000:.1f} ms", file=sys.stderr)
+    steps = ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in results["warm_up"]["steps"].items())
+    print(f"warm_up(): {results['warm_up']['seconds'] * 1000:.1f} ms ({steps})", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
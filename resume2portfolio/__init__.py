@@ -0,0 +1,30 @@
+from .extract import (
+    EXTRACTOR_VERSION, MAX_PAGES, MAX_TEXT_CHARS, MAX_FILE_BYTES,
+    extract_pdf_text, extract_pdf_lines, iter_pdf_pages, extract_fields,
+    find_email, find_phone, find_linkedin, find_github, guess_name,
+    extract_skills, extract_education, extract_certifications, extract_projects,
+)
+from .portfolio import (
+    THEMES, ROLES, RANDOM_THEME, pick_theme, build_profile, profile_from_fields,
+    generate_simple_faq, generate_css, build_portfolio, render_artifacts, package_portfolio,
+    zip_folder,
+)
+from .qr import portfolio_url, generate_qr_code, qr_png, qr_svg, qr_matrix
+from .cache import ExtractionCache, cache_key, content_digest
+from .templating import TEMPLATE_DIR, get_env, get_template, warm_templates
+from .jobs import Job, JobQueue, JobCancelled, JobLimitError, generation_job
+from .metrics import METRICS, StageMetrics, timed, profiled, serve_metrics
+from .retrieval import ResumeIndex, tokenize
+from .store import ProfileStore
+from .ocr import (
+    OcrEngine, ocr_available, is_image_only, page_hash,
+    PAGE_CACHE_NAMESPACE, PAGE_CACHE_ENTRIES, PAGE_CACHE_DISK_BUDGET,
+)
+from .assets import minify_css, minify_html, self_host_fonts, precompress, optimize_site, optimize_folder
+from .layout import Line, Section, SECTION_HEADINGS, page_lines, text_lines, lines_text, segment, section_kind, sections_of
+from .model import Theme, Project, Profile, dumps_json, loads_json, pack, unpack
+from .artifacts import ArtifactStore, ZIP_NAME
+from .export import SiteExport, hashed_name, is_shared
+from .startup import HEAVY_MODULES, loaded_heavy_modules, warm_up
+from .admission import AdmissionController, AdmissionError, UploadRejected, RateLimited, Overloaded, TokenBucket, precheck_pdf
+from .taxonomy import Skill, SkillTaxonomy, TAXONOMY_PATH, load_taxonomy, get_taxonomy, skill_tokens
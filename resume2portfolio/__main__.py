@@ -0,0 +1,51 @@
+import argparse
+import json
+import sys
+
+from .batch import run_batch
+from .portfolio import THEMES, ROLES, RANDOM_THEME
+from .store import ProfileStore
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="resume2portfolio", description="Resume2PortfolioAI Pro command line tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    batch = sub.add_parser("batch", help="Generate portfolios for every PDF in a directory.")
+    batch.add_argument("in_dir", help="Directory containing resume PDFs.")
+    batch.add_argument("out_dir", help="Directory to write portfolios, ZIPs and the report into.")
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    batch.add_argument("--role", default="Software Engineer", choices=ROLES, help="Role tagline for every portfolio.")
+    batch.add_argument("--theme", default=RANDOM_THEME, choices=[RANDOM_THEME] + [t.name for t in THEMES])
+    batch.add_argument("--report", default=None, help="JSONL report path (default: <out_dir>/report.jsonl).")
+    batch.add_argument("--cache-dir", default=None, help="Share extraction results across runs via this directory.")
+    batch.add_argument("--store", default=None, help="SQLite profile store to add every candidate to; also writes a cohort index.html.")
+    batch.add_argument("--ocr", action="store_true", help="OCR image-only pages with Tesseract (must be installed).")
+    batch.add_argument("--optimize", action="store_true",
+                       help="Minify, inline CSS, self-host fonts from R2P_FONTS_DIR and write .gz/.br siblings.")
+    batch.add_argument("--site", default=None,
+                       help="Export every portfolio into one static site (directory, or .zip) with shared assets stored once.")
+
+    query = sub.add_parser("query", help="Find candidates in a profile store.")
+    query.add_argument("store", help="SQLite profile store written by 'batch --store'.")
+    query.add_argument("--skill", action="append", default=[], help="Required skill (repeatable).")
+    query.add_argument("--education", default=None, help="Substring an education entry must contain.")
+    query.add_argument("--limit", type=int, default=None)
+    query.add_argument("--json", action="store_true", help="Print one JSON object per candidate.")
+
+    args = parser.parse_args(argv)
+    if args.command == "batch":
+        ok, failed = run_batch(args.in_dir, args.out_dir, workers=args.workers, role=args.role,
+                               theme_choice=args.theme, report_path=args.report, cache_dir=args.cache_dir,
+                               store_path=args.store, ocr=args.ocr, optimize=args.optimize,
+                               site_path=args.site)
+        print(f"Done: {ok} succeeded, {failed} failed.", file=sys.stderr)
+        return 1 if failed else 0
+    if args.command == "query":
+        store = ProfileStore(args.store)
+        for p in store.find(args.skill, args.education, args.limit):
+            print(json.dumps(p) if args.json else f"{p['name']} <{p['email']}> {p['path'] or ''}")
+        store.close()
+        return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+from .extract import MAX_PAGES, MAX_FILE_BYTES
+from .jobs import JobCancelled, JobLimitError
+
+# ---------- Upload Admission Control ----------
+SESSION_RATE = float(os.environ.get("R2P_SESSION_RATE", 0.1))  # generations per second, per session
+SESSION_BURST = float(os.environ.get("R2P_SESSION_BURST", 3))
+GLOBAL_RATE = float(os.environ.get("R2P_GLOBAL_RATE", 2))
+GLOBAL_BURST = float(os.environ.get("R2P_GLOBAL_BURST", 10))
+MAX_WAITING = int(os.environ.get("R2P_MAX_WAITING", 20))
+MAX_TRACKED_SESSIONS = 4096
+PRECHECK_CACHE_SIZE = 256
+
+class AdmissionError(Exception):
+    """
+    A request turned away before it reached the pipeline. str(e) is meant for the user;
+    retry_after (seconds) is set when trying again later will help.
+    """
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class UploadRejected(AdmissionError):
+    pass
+
+class RateLimited(AdmissionError):
+    pass
+
+class Overloaded(AdmissionError):
+    pass
+
+class TokenBucket:
+    """
+    Allows `rate` units per second on average with bursts of up to `capacity`.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, cost=1.0):
+        """
+        Takes `cost` tokens and returns 0, or returns how many seconds until they would be available.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return 0.0
+            return (cost - self.tokens) / self.rate if self.rate else float("inf")
+
+    def refund(self, cost=1.0):
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + cost)
+
+    @property
+    def full(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return self.tokens >= self.capacity
+
+def precheck_pdf(pdf_bytes, max_bytes=MAX_FILE_BYTES, max_pages=MAX_PAGES):
+    """
+    Cheap checks before any extraction: byte size, PDF signature, encryption and page count (read from
+    the document's page tree; no page is loaded). Returns the page count or raises UploadRejected.
+    """
+    size = len(pdf_bytes)
+    if max_bytes and size > max_bytes:
+        raise UploadRejected(f"This PDF is {size / 2**20:.1f} MB; the limit is {max_bytes / 2**20:.0f} MB.")
+    if b"%PDF" not in pdf_bytes[:1024]:
+        raise UploadRejected("This file does not look like a PDF.")
+
+    import fitz
+
+    try:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    except Exception:
+        raise UploadRejected("This PDF could not be opened; it may be damaged.")
+    with doc:
+        if doc.needs_pass:
+            raise UploadRejected("This PDF is password-protected. Please upload an unlocked copy.")
+        pages = doc.page_count
+    if not pages:
+        raise UploadRejected("This PDF has no pages.")
+    if max_pages and pages > max_pages:
+        raise UploadRejected(f"This PDF has {pages} pages; resumes of up to {max_pages} pages are accepted.")
+    return pages
+
+class AdmissionController:
+    """
+    Gatekeeper in front of a JobQueue: prechecks the upload, applies per-session and global token
+    buckets, refuses new work once max_waiting jobs are queued (with an estimated wait instead of a
+    timeout), and runs admitted jobs under a semaphore of max_concurrent slots.
+    """
+    def __init__(self, queue, session_rate=SESSION_RATE, session_burst=SESSION_BURST, global_rate=GLOBAL_RATE,
+                 global_burst=GLOBAL_BURST, max_concurrent=None, max_waiting=MAX_WAITING,
+                 max_file_bytes=MAX_FILE_BYTES, max_pages=MAX_PAGES):
+        self.queue = queue
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.max_concurrent = max_concurrent or queue.max_workers
+        self.max_waiting = max_waiting
+        self.max_file_bytes = max_file_bytes
+        self.max_pages = max_pages
+        self.avg_seconds = 2.0  # moving average of admitted job durations, for wait estimates
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._sessions = {}
+        self._prechecked = OrderedDict()  # upload key -> page count
+        self._lock = threading.Lock()
+
+    def _session_bucket(self, owner):
+        with self._lock:
+            bucket = self._sessions.get(owner)
+            if bucket is None:
+                if len(self._sessions) >= MAX_TRACKED_SESSIONS:
+                    # Full buckets carry no state worth keeping
+                    self._sessions = {k: b for k, b in self._sessions.items() if not b.full}
+                bucket = self._sessions[owner] = TokenBucket(self.session_rate, self.session_burst)
+            return bucket
+
+    def estimated_wait(self, ahead):
+        return round(self.avg_seconds * (ahead + 1) / self.max_concurrent)
+
+    def precheck(self, pdf_bytes, key=None):
+        """
+        precheck_pdf with the result remembered per upload key, so re-renders of an accepted upload
+        never open it with PyMuPDF again.
+        """
+        with self._lock:
+            if key is not None and key in self._prechecked:
+                self._prechecked.move_to_end(key)
+                return self._prechecked[key]
+        pages = precheck_pdf(pdf_bytes, self.max_file_bytes, self.max_pages)
+        if key is not None:
+            with self._lock:
+                self._prechecked[key] = pages
+                if len(self._prechecked) > PRECHECK_CACHE_SIZE:
+                    self._prechecked.popitem(last=False)
+        return pages
+
+    def submit(self, owner, pdf_bytes, fn, *args, cost=1.0, upload_key=None, supersede=False, **kwargs):
+        """
+        Admits fn(job, *args, **kwargs) for `owner` and returns its Job, or raises an AdmissionError
+        (or JobLimitError) without consuming any tokens. cost < 1 suits cheap re-renders;
+        upload_key (the upload's cache key) lets repeat submissions skip the PDF precheck.
+        With supersede, the owner's unfinished jobs are cancelled, but only once the new one has
+        passed every check, so a rejected request leaves them running.
+        """
+        self.precheck(pdf_bytes, upload_key)
+
+        waiting = self.queue.waiting()
+        if self.max_waiting and waiting >= self.max_waiting:
+            wait = self.estimated_wait(waiting)
+            raise Overloaded(f"The server is busy: {waiting} portfolios are queued ahead of you. "
+                             f"Please try again in about {wait} seconds.", retry_after=wait)
+
+        session = self._session_bucket(owner)
+        wait = session.take(cost)
+        if wait:
+            raise RateLimited(f"You are generating portfolios too quickly. Try again in {wait:.0f} seconds.",
+                              retry_after=wait)
+        wait = self.global_bucket.take(cost)
+        if wait:
+            session.refund(cost)
+            raise RateLimited(f"The server is handling a burst of requests. Try again in {wait:.0f} seconds.",
+                              retry_after=wait)
+        if supersede:
+            self.queue.cancel_owner(owner)
+        try:
+            return self.queue.submit(owner, self._run, fn, *args, **kwargs)
+        except JobLimitError:
+            session.refund(cost)
+            self.global_bucket.refund(cost)
+            raise
+
+    def _run(self, job, fn, *args, **kwargs):
+        # Holds the job in the queue (and in queue positions) until a slot frees up.
+        job.status, job.stage = "queued", "Waiting for a free slot..."
+        while not self._slots.acquire(timeout=0.1):
+            if job.cancelled():
+                raise JobCancelled(job.id)
+        job.status = "running"
+        start = time.monotonic()
+        try:
+            return fn(job, *args, **kwargs)
+        finally:
+            self._slots.release()
+            self.avg_seconds = 0.8 * self.avg_seconds + 0.2 * (time.monotonic() - start)
+
+    def position(self, job):
+        return self.queue.position(job)
@@ -0,0 +1,212 @@
+import os
+import time
+import uuid
+import shutil
+import socket
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .metrics import METRICS
+
+# ---------- Managed Build Output Store ----------
+# Parent of the per-instance store directories; several app processes may share it
+ARTIFACT_DIR = os.environ.get("R2P_ARTIFACT_DIR") or os.path.join(tempfile.gettempdir(), "r2p-artifacts")
+ARTIFACT_BUDGET = int(os.environ.get("R2P_ARTIFACT_BUDGET", 512 * 1024 * 1024))
+ARTIFACT_MAX_AGE = float(os.environ.get("R2P_ARTIFACT_MAX_AGE", 24 * 3600))
+TMP_GRACE = 3600  # a temp dir older than this is a crashed write, not one in progress
+ZIP_NAME = "portfolio.zip"
+_TMP_PREFIX = ".tmp-"
+_INSTANCE_PREFIX = "store-"
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return False  # a directory left by an earlier process that had our pid
+    if os.name != "posix":
+        return True  # os.kill(pid, 0) would terminate the process on Windows; rely on max_age
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # exists, but owned by another user
+    return True
+
+def _instance_gone(name, host):
+    # Instance directories are named store-<host>-<pid>-<random>
+    owner, _, rest = name[len(_INSTANCE_PREFIX):].rpartition("-")
+    owner_host, _, pid = owner.rpartition("-")
+    return owner_host == host and pid.isdigit() and not _pid_alive(int(pid))
+
+def instance_root(base=ARTIFACT_DIR, max_age=ARTIFACT_MAX_AGE):
+    """
+    Creates a directory under base for one store instance. Sibling instance directories whose
+    process has exited on this host are removed, so a restart does not leave its builds outside any
+    budget; those idle for longer than max_age (e.g. from another host) are removed as well.
+    """
+    os.makedirs(base, exist_ok=True)
+    host = socket.gethostname().replace(os.sep, "_")
+    now = time.time()
+    for entry in os.scandir(base):
+        if not (entry.is_dir() and entry.name.startswith(_INSTANCE_PREFIX)):
+            continue
+        try:
+            stale = _instance_gone(entry.name, host) or (max_age and now - entry.stat().st_mtime > max_age)
+        except OSError:
+            continue
+        if stale:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    return tempfile.mkdtemp(prefix=f"{_INSTANCE_PREFIX}{host}-{os.getpid()}-", dir=base)
+
+class ArtifactStore:
+    """
+    Keeps generated portfolios under root/<build id>/, each published atomically by renaming a fully
+    written temp directory. Without a root, each store gets its own directory from instance_root(), so
+    processes sharing ARTIFACT_DIR never evict or clean up each other's builds. Builds idle for longer than max_age are deleted, and the least recently
+    used ones go once the store exceeds max_bytes. File listings come from an in-memory index, so
+    lookups never walk the directory tree; the tree is only scanned once, at startup.
+    """
+    def __init__(self, root=None, max_bytes=ARTIFACT_BUDGET, max_age=ARTIFACT_MAX_AGE):
+        self.root = root = root or instance_root(max_age=max_age)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._builds = OrderedDict()  # build id -> {"files": {name: size}, "bytes": int, "used": float}
+        os.makedirs(root, exist_ok=True)
+        self._scan()
+        self.gc()
+
+    def _scan(self):
+        found = []
+        now = time.time()
+        for entry in os.scandir(self.root):
+            if not entry.is_dir():
+                continue
+            if entry.name.startswith(_TMP_PREFIX):
+                # Left over from a crash mid-write, unless it is recent enough to still be in progress
+                if now - entry.stat().st_mtime > TMP_GRACE:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                continue
+            files = {}
+            for dirpath, _, names in os.walk(entry.path):
+                for name in names:
+                    path = os.path.join(dirpath, name)
+                    files[os.path.relpath(path, entry.path).replace(os.sep, "/")] = os.path.getsize(path)
+            found.append((entry.stat().st_mtime, entry.name, files))
+        for used, build_id, files in sorted(found):
+            self._builds[build_id] = {"files": files, "bytes": sum(files.values()), "used": used}
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return sum(b["bytes"] for b in self._builds.values())
+
+    def __len__(self):
+        return len(self._builds)
+
+    def __contains__(self, build_id):
+        return build_id in self._builds
+
+    def put(self, files, zip_bytes=None):
+        """
+        Stores {name: bytes} (plus the packaged ZIP) under a new unique build id and returns the id.
+        """
+        build_id = uuid.uuid4().hex
+        tmp = tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self.root)
+        sizes = {}
+        try:
+            with METRICS.stage("store") as rec:
+                if zip_bytes is not None:
+                    files = dict(files, **{ZIP_NAME: zip_bytes})
+                for name, content in files.items():
+                    path = os.path.join(tmp, name)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as f:
+                        f.write(content)
+                    sizes[name] = len(content)
+                rec["bytes"] = sum(sizes.values())
+                os.rename(tmp, os.path.join(self.root, build_id))
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        with self._lock:
+            self._builds[build_id] = {"files": sizes, "bytes": sum(sizes.values()), "used": time.time()}
+        self.gc(keep=build_id)
+        return build_id
+
+    def touch(self, build_id):
+        with self._lock:
+            build = self._builds.get(build_id)
+            if build is None:
+                return False
+            build["used"] = time.time()
+            self._builds.move_to_end(build_id)
+        try:
+            os.utime(os.path.join(self.root, build_id))  # keeps LRU order across restarts
+            os.utime(self.root)  # marks the instance directory as in use (see instance_root)
+        except OSError:
+            pass
+        return True
+
+    def files(self, build_id):
+        """
+        {name: size in bytes} of the portfolio files in a build (without the ZIP), or None if it is gone.
+        """
+        if not self.touch(build_id):
+            return None
+        with self._lock:
+            build = self._builds.get(build_id)
+            return {n: s for n, s in build["files"].items() if n != ZIP_NAME} if build else None
+
+    def path(self, build_id, name=ZIP_NAME):
+        with self._lock:
+            build = self._builds.get(build_id)
+            if build is None or name not in build["files"]:
+                return None
+        return os.path.join(self.root, build_id, name)
+
+    def read(self, build_id, name=ZIP_NAME):
+        path = self.path(build_id, name)
+        if path is None or not self.touch(build_id):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def delete(self, build_id):
+        with self._lock:
+            if self._builds.pop(build_id, None) is None:
+                return
+        self._remove(build_id)
+
+    def _remove(self, build_id):
+        # Rename first so readers never see a half-deleted build.
+        src = os.path.join(self.root, build_id)
+        doomed = os.path.join(self.root, f"{_TMP_PREFIX}{build_id}")
+        try:
+            os.rename(src, doomed)
+        except OSError:
+            return
+        shutil.rmtree(doomed, ignore_errors=True)
+
+    def gc(self, now=None, keep=None):
+        """
+        Deletes builds idle for longer than max_age, then the least recently used ones until the
+        store fits in max_bytes (never evicting `keep`, the build just written). Returns the removed ids.
+        """
+        now = time.time() if now is None else now
+        removed = []
+        with self._lock:
+            total = sum(b["bytes"] for b in self._builds.values())
+            for build_id, build in list(self._builds.items()):
+                expired = self.max_age and now - build["used"] > self.max_age
+                if not expired and (build_id == keep or not self.max_bytes or total <= self.max_bytes):
+                    continue
+                total -= build["bytes"]
+                del self._builds[build_id]
+                removed.append(build_id)
+        for build_id in removed:
+            self._remove(build_id)
+        return removed
@@ -0,0 +1,167 @@
+import os
+import re
+import gzip
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz siblings without it
+    brotli = None
+
+
+from .metrics import timed
+
+FONTS_DIR = os.environ.get("R2P_FONTS_DIR")
+# Weights requested by templates/index.html for each theme font
+FONT_WEIGHTS = {"font_heading": (600, 800), "font_body": (300, 400, 600)}
+CRITICAL_CSS_LIMIT = 14 * 1024
+PRECOMPRESS_EXTENSIONS = (".html", ".css", ".json", ".svg", ".js")
+
+# ---------- Minification ----------
+_PRESERVE_RE = re.compile(r"(<(script|pre|textarea|style)\b[^>]*>.*?</\2\s*>)", re.S | re.I)
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r"([{;])\s*([\w-]+)\s*:\s*", r"\1\2:", css)
+    return css.replace(";}", "}").strip()
+
+def minify_html(html):
+    """
+    Drops comments and collapses whitespace runs to a single space (which is how browsers render them),
+    leaving <script>, <pre> and <textarea> bodies untouched and minifying inline <style> blocks.
+    """
+    out = []
+    for i, part in enumerate(_PRESERVE_RE.split(html)):
+        if i % 3 == 2:
+            continue  # tag name captured by the inner group
+        if i % 3 == 1:
+            if part[:6].lower() == "<style":
+                head, body = part.split(">", 1)
+                body, tail = body.rsplit("</", 1)
+                part = f"{head}>{minify_css(body)}</{tail}"
+            out.append(part)
+            continue
+        part = re.sub(r"<!--(?!\[if).*?-->", "", part, flags=re.S)
+        out.append(re.sub(r"\s+", " ", part))
+    return "".join(out).strip()
+
+# ---------- Fonts ----------
+def _font_file(fonts_dir, family, weight):
+    path = os.path.join(fonts_dir, f"{family.replace(' ', '')}-{weight}.woff2")
+    return path if os.path.exists(path) else None
+
+def _subset_font(path, text):
+    try:
+        from fontTools import subset as font_subset  # optional and slow to import: only load when subsetting
+    except ImportError:  # fonts are copied whole without it
+        with open(path, "rb") as f:
+            return f.read()
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = font_subset.load_font(path, options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    from io import BytesIO
+    buf = BytesIO()
+    font_subset.save_font(font, buf, options)
+    return buf.getvalue()
+
+def self_host_fonts(html, theme, fonts_dir):
+    """
+    Returns (html, {font path: bytes}) with the Google Fonts link replaced by @font-face rules for
+    only the weights the template uses, subset to the page's characters when fontTools is installed.
+    Leaves the page untouched unless every needed weight exists in fonts_dir.
+    """
+    faces, files = [], {}
+    for key, weights in FONT_WEIGHTS.items():
+        family = getattr(theme, key)
+        for weight in weights:
+            path = _font_file(fonts_dir, family, weight)
+            if path is None:
+                return html, {}
+            name = f"fonts/{family.replace(' ', '')}-{weight}.woff2"
+            if name not in files:
+                files[name] = _subset_font(path, html)
+                faces.append(f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+                             f"font-display:swap;src:url({name}) format('woff2')}}")
+    html = re.sub(r'<link[^>]*fonts\.(googleapis|gstatic)\.com[^>]*>', "", html)
+    html = html.replace("</head>", f"<style>{''.join(faces)}</style></head>", 1)
+    return html, files
+
+# ---------- Site Optimisation ----------
+def _defer_stylesheet(html, host):
+    # Non-critical third-party CSS: load without blocking first paint, with a no-JS fallback.
+    def repl(m):
+        tag = m.group(0)
+        deferred = tag.replace('rel="stylesheet"', 'rel="stylesheet" media="print" onload="this.media=\'all\'"')
+        return f"{deferred}<noscript>{tag}</noscript>"
+    return re.sub(rf'<link[^>]*href="https://{re.escape(host)}[^"]*"[^>]*>', repl, html)
+
+def precompress(files):
+    """
+    Adds .gz (and .br when brotli is installed) siblings for every text asset, for static hosts
+    that serve pre-compressed files.
+    """
+    out = dict(files)
+    for name, content in files.items():
+        if name.endswith(PRECOMPRESS_EXTENSIONS):
+            out[f"{name}.gz"] = gzip.compress(content, compresslevel=9, mtime=0)
+            if brotli is not None:
+                out[f"{name}.br"] = brotli.compress(content, quality=11)
+    return out
+
+@timed("optimize", size=lambda result, *args: sum(len(c) for c in result.values()))
+def optimize_site(files, theme, fonts_dir=FONTS_DIR, compress=True, inline_css=True):
+    """
+    Post-processes rendered portfolio files ({name: bytes}) for fast first paint: minified HTML/CSS,
+    style.css inlined into index.html, self-hosted theme fonts (when fonts_dir has them), deferred
+    Font Awesome, and pre-compressed siblings. Bulk exports pass inline_css=False so the stylesheet
+    stays a separate file that many pages can share.
+    """
+    files = dict(files)
+    html = files["index.html"].decode("utf-8")
+
+    css = files.get("style.css")
+    if css is not None:
+        css = minify_css(css.decode("utf-8"))
+        if inline_css and len(css) <= CRITICAL_CSS_LIMIT:
+            html = html.replace('<link rel="stylesheet" href="style.css">', f"<style>{css}</style>", 1)
+            del files["style.css"]
+        else:
+            files["style.css"] = css.encode("utf-8")
+
+    if fonts_dir:
+        html, fonts = self_host_fonts(html, theme, fonts_dir)
+        files.update(fonts)
+    html = _defer_stylesheet(html, "cdnjs.cloudflare.com")
+    files["index.html"] = minify_html(html).encode("utf-8")
+    return precompress(files) if compress else files
+
+def optimize_folder(folder_path, theme, fonts_dir=FONTS_DIR, compress=True):
+    """
+    optimize_site() applied in place to a portfolio directory written by build_portfolio.
+    """
+    names = [n for n in ("index.html", "style.css") if os.path.exists(os.path.join(folder_path, n))]
+    before = {}
+    for name in names:
+        with open(os.path.join(folder_path, name), "rb") as f:
+            before[name] = f.read()
+    for name in ("data.json", "qr.svg"):
+        path = os.path.join(folder_path, name)
+        if compress and os.path.exists(path):
+            with open(path, "rb") as f:
+                before[name] = f.read()
+    after = optimize_site(before, theme, fonts_dir, compress)
+    for name in before:
+        if name not in after:
+            os.remove(os.path.join(folder_path, name))
+    for name, content in after.items():
+        if before.get(name) == content:
+            continue
+        path = os.path.join(folder_path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
@@ -0,0 +1,184 @@
+import os
+import sys
+import time
+import shutil
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .cache import ExtractionCache, cache_key, content_digest
+from .store import ProfileStore
+from .portfolio import pick_theme, profile_from_fields, build_portfolio, render_artifacts, zip_folder
+from .startup import warm_up
+from .metrics import METRICS, profiled
+from .ocr import OcrEngine, PAGE_CACHE_NAMESPACE, PAGE_CACHE_ENTRIES, PAGE_CACHE_DISK_BUDGET
+from .assets import optimize_folder, optimize_site
+from .export import SiteExport
+from .model import Profile, dumps_json
+
+_worker_cache = None
+_started = None
+
+def _get_cache(cache_dir, ocr=False):
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = ExtractionCache(disk_dir=cache_dir)
+        if ocr:
+            # Batch workers are already one per core, so OCR runs inline in each of them.
+            pages = _worker_cache.namespace(PAGE_CACHE_NAMESPACE, PAGE_CACHE_ENTRIES, PAGE_CACHE_DISK_BUDGET)
+            _worker_cache.ocr = OcrEngine(max_workers=0, cache=pages)
+    return _worker_cache
+
+def _init_worker(started):
+    global _started
+    _started = started
+    warm_up()
+
+def _run_one(pdf_path, *args):
+    # Reported before any work, so a worker that dies mid-file can be traced back to that file
+    _started.put(pdf_path)
+    return process_resume(pdf_path, *args)
+
+def _crash_record(pdf_path):
+    return {"file": pdf_path, "status": "error", "seconds": 0.0,
+            "error": "BrokenProcessPool: the worker process crashed while processing this file."}
+
+# ---------- Batch Pipeline ----------
+def find_resumes(in_dir):
+    return sorted(
+        os.path.join(in_dir, f) for f in os.listdir(in_dir)
+        if f.lower().endswith(".pdf") and os.path.isfile(os.path.join(in_dir, f))
+    )
+
+def process_resume(pdf_path, out_root, role, theme_choice, cache_dir=None, ocr=False, optimize=False, site=False):
+    """
+    Runs the full pipeline for one resume and returns a JSON-serialisable report record, plus the
+    Profile packed to bytes under "profile" (smaller to ship back from the worker than a pickle) and
+    the skills and education actually extracted under "indexed", for the ProfileStore.
+    With site=True nothing is written; the rendered files come back under "files" for a SiteExport.
+    """
+    stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    out_dir = os.path.join(out_root, stem)
+    zip_path = f"{out_dir}.zip"
+    start = time.perf_counter()
+    try:
+        with METRICS.collect() as stages, profiled(stem):
+            key = cache_key(pdf_path)
+            _, fields = _get_cache(cache_dir, ocr).get_or_extract(pdf_path, key)
+            data = profile_from_fields(fields, role, pick_theme(theme_choice))
+            if site:
+                with open(pdf_path, "rb") as f:
+                    files = {n: c for n, (_, c) in render_artifacts(data, f.read(), pdf_key=key).items()}
+                if optimize:
+                    files = optimize_site(files, data.theme, compress=False, inline_css=False)
+            else:
+                build_portfolio(out_dir, data)
+                shutil.copyfile(pdf_path, os.path.join(out_dir, "resume.pdf"))
+                if optimize:
+                    optimize_folder(out_dir, data.theme)
+                zip_folder(out_dir, zip_path)
+        record = {"file": pdf_path, "status": "ok", "name": data.name, "theme": data.theme.name,
+                  "output": out_dir, "zip": zip_path, "seconds": round(time.perf_counter() - start, 4),
+                  "stages": {name: {k: round(v, 4) for k, v in rec.items()} for name, rec in stages.items()},
+                  "key": key, "profile": data.pack(),
+                  "indexed": {"skills": list(fields["skills"]), "education": list(fields["education"])}}
+        if site:
+            record.update(output=None, zip=None, files=files)
+        return record
+    except Exception as e:
+        return {"file": pdf_path, "status": "error", "error": f"{type(e).__name__}: {e}",
+                "traceback": traceback.format_exc(), "seconds": round(time.perf_counter() - start, 4)}
+
+def run_batch(in_dir, out_dir, workers=None, role="Software Engineer", theme_choice="Random (Auto)",
+              report_path=None, cache_dir=None, store_path=None, ocr=False, optimize=False, site_path=None,
+              log=sys.stderr):
+    """
+    Fans process_resume out over a process pool, appending one JSONL record per resume as it finishes.
+    A file that kills its worker (e.g. a MuPDF crash) does not end the run: the pool is restarted for
+    the files that had not started, and the ones in flight are retried alone, one process each, so
+    only the culprit gets an error record.
+    With store_path, every profile is also added to a ProfileStore and a cohort index.html is written
+    to out_dir. With site_path (a directory or .zip), portfolios go into one SiteExport instead of a
+    folder and ZIP each, and the cohort page becomes the site's index.html. Returns (succeeded, failed) counts.
+    """
+    pdfs = find_resumes(in_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    report_path = report_path or os.path.join(out_dir, "report.jsonl")
+    ok = failed = 0
+    store = ProfileStore(store_path) if store_path else None
+    site = SiteExport(site_path) if site_path else None
+
+    args = (out_dir, role, theme_choice, cache_dir, ocr, optimize, site is not None)
+    started = multiprocessing.SimpleQueue()
+    done = 0
+
+    def run_round(paths, max_workers):
+        # Returns the paths whose futures were lost to a broken pool, and which of those had started.
+        lost = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(started,)) as pool:
+            futures = {pool.submit(_run_one, p, *args): p for p in paths}
+            for fut in as_completed(futures):
+                try:
+                    record = fut.result()
+                except BrokenProcessPool:
+                    lost.append(futures[fut])
+                    continue
+                finish(record)
+        in_flight = set()
+        while not started.empty():
+            in_flight.add(started.get())
+        return lost, in_flight
+
+    def finish(record):
+        nonlocal ok, failed, done
+        done += 1
+        profile = record.pop("profile", None)
+        indexed = record.pop("indexed", None)
+        if record["status"] == "ok":
+            ok += 1
+            if site is not None:
+                page = site.add(os.path.splitext(os.path.basename(record["file"]))[0], record.pop("files"))
+                record["output"] = f"{site_path}:{page}" if site.archive else os.path.join(site_path, os.path.dirname(page))
+            else:
+                page = os.path.relpath(os.path.join(record["output"], "index.html"), out_dir)
+            if store is not None:
+                store.add(Profile.unpack(profile), pdf_key=content_digest(record["key"]), path=page.replace(os.sep, "/"),
+                          **indexed)
+        else:
+            failed += 1
+        report.write(dumps_json(record).decode("utf-8") + "\n")
+        report.flush()
+        if log:
+            print(f"[{done}/{len(pdfs)}] {record['status']:5} {os.path.basename(record['file'])}", file=log)
+
+    with open(report_path, "a", encoding="utf-8") as report:
+        pending, suspects = pdfs, []
+        while pending:
+            lost, in_flight = run_round(pending, workers)
+            crashed = [p for p in lost if p in in_flight]
+            suspects += crashed
+            pending = [p for p in lost if p not in in_flight]
+            if lost and not crashed:
+                # The pool broke before any file started (e.g. in the initializer): give up on the rest
+                for p in pending:
+                    finish(_crash_record(p))
+                pending = []
+        for p in suspects:
+            lost, _ = run_round([p], 1)
+            if lost:
+                finish(_crash_record(p))
+
+    if store is not None:
+        if site is not None:
+            site.add_root("index.html", store.cohort_html())
+        else:
+            store.render_cohort(os.path.join(out_dir, "index.html"))
+        store.close()
+    if site is not None:
+        site.close()
+        if log:
+            s = site.stats
+            print(f"Site: {s['pages']} pages, {s['assets']} shared assets, {s['bytes']:,} B written, "
+                  f"{s['deduplicated_bytes']:,} B deduplicated", file=log)
+    return ok, failed
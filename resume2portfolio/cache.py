@@ -0,0 +1,178 @@
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .extract import EXTRACTOR_VERSION, extract_pdf_lines, extract_fields
+from .taxonomy import taxonomy_version
+from .layout import lines_text, segment
+from .retrieval import ResumeIndex
+from .metrics import METRICS
+from .model import pack, unpack
+
+DISK_SUFFIX = ".bin"
+
+# ---------- Content-Addressed Extraction Cache ----------
+def cache_key(source):
+    """
+    source is raw PDF bytes or a path; paths are hashed in chunks rather than read whole.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    else:
+        digest = hashlib.sha256(source)
+    return f"{digest.hexdigest()}-v{EXTRACTOR_VERSION}-{taxonomy_version()}"
+
+def content_digest(key):
+    """
+    The SHA-256 part of a cache_key: identifies the PDF itself, whatever the extractor version.
+    """
+    return key.split("-", 1)[0]
+
+class ExtractionCache:
+    """
+    Caches (text, fields) per PDF, keyed by the SHA-256 of its bytes plus EXTRACTOR_VERSION.
+    Tier 1 is an in-memory LRU; tier 2 is an optional directory of packed (msgpack or compact JSON)
+    files evicted oldest-first once it grows past disk_budget bytes.
+    """
+    def __init__(self, max_entries=256, disk_dir=None, disk_budget=256 * 1024 * 1024, ocr=None):
+        self.max_entries = max_entries
+        self.ocr = ocr
+        self.disk_dir = disk_dir
+        self.disk_budget = disk_budget
+        self.hits = self.misses = 0
+        self._mem = OrderedDict()
+        self._indexes = OrderedDict()  # key -> ResumeIndex, memory only and never packed
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(e.stat().st_size for e in self._disk_entries())
+
+    def namespace(self, name, max_entries, disk_budget):
+        """
+        A separate cache with its own LRU and disk budget (in a subdirectory of disk_dir), for
+        entries that should not compete with whole-resume extractions.
+        """
+        disk_dir = os.path.join(self.disk_dir, name) if self.disk_dir else None
+        return ExtractionCache(max_entries=max_entries, disk_dir=disk_dir, disk_budget=disk_budget)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return self._mem[key]
+        entry = self._disk_get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._mem_put(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._mem_put(key, entry)
+        self._disk_put(key, entry)
+
+    def get_or_extract(self, source, key=None):
+        """
+        Returns (text, fields) for the PDF (bytes or path), only parsing it with PyMuPDF on a cache miss.
+        Pass `key` if cache_key(source) has already been computed.
+        """
+        _, entry = self._entry(source, key)
+        return entry["text"], entry["fields"]
+
+    def get_or_extract_indexed(self, source, key=None):
+        """
+        get_or_extract plus the ResumeIndex over the text. Indexes are built once and kept in their
+        own in-memory LRU (never on disk), so re-renders of the same upload reuse them.
+        """
+        key, entry = self._entry(source, key)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+        if index is None:
+            with METRICS.stage("index"):
+                index = ResumeIndex.from_text(entry["text"])
+            with self._lock:
+                self._indexes[key] = index
+                while len(self._indexes) > self.max_entries:
+                    self._indexes.popitem(last=False)
+        return entry["text"], entry["fields"], index
+
+    def _entry(self, source, key):
+        key = key or cache_key(source)
+        if self.ocr is not None:
+            key = f"{key}-{self.ocr.signature}"
+        entry = self.get(key)
+        if entry is None:
+            with METRICS.stage("pdf_parse") as rec:
+                lines = extract_pdf_lines(source, ocr=self.ocr)
+                rec["bytes"] = len(source) if isinstance(source, (bytes, bytearray)) else os.path.getsize(source)
+            with METRICS.stage("extract") as rec:
+                text = lines_text(lines)
+                fields = extract_fields(text, segment(lines))
+                rec["bytes"] = len(text)
+            entry = {"text": text, "fields": fields}
+            self.put(key, entry)
+        return key, entry
+
+    def _mem_put(self, key, entry):
+        self._mem[key] = entry
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def _disk_entries(self):
+        return [e for e in os.scandir(self.disk_dir) if e.is_file() and e.name.endswith(DISK_SUFFIX)]
+
+    def _disk_get(self, key):
+        if not self.disk_dir:
+            return None
+        path = os.path.join(self.disk_dir, f"{key}{DISK_SUFFIX}")
+        try:
+            with open(path, "rb") as f:
+                entry = unpack(f.read())
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def _disk_put(self, key, entry):
+        if not self.disk_dir:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pack(entry))
+            size = os.path.getsize(tmp)
+            os.replace(tmp, os.path.join(self.disk_dir, f"{key}{DISK_SUFFIX}"))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        with self._lock:
+            self._disk_bytes += size
+            if self._disk_bytes > self.disk_budget:
+                self._disk_evict()
+
+    def _disk_evict(self):
+        entries = sorted(self._disk_entries(), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in entries)
+        for e in entries:
+            if total <= self.disk_budget:
+                break
+            try:
+                size = e.stat().st_size
+                os.remove(e.path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
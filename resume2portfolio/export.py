@@ -0,0 +1,110 @@
+import os
+import re
+import hashlib
+import zipfile
+import tempfile
+
+from .portfolio import _compress_type
+
+# ---------- Bulk Static-Site Export ----------
+ASSET_DIR = "assets"
+# Files every portfolio of a theme has in common; stored once and linked from each page
+SHARED_NAMES = ("style.css",)
+SHARED_PREFIXES = ("fonts/",)
+HASH_LENGTH = 12
+
+def is_shared(name):
+    return name in SHARED_NAMES or name.startswith(SHARED_PREFIXES)
+
+def hashed_name(name, content):
+    """
+    "fonts/Inter-400.woff2" -> "fonts/Inter-400.<sha256 prefix>.woff2"
+    """
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{ext}"
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", text).strip("-.") or "portfolio"
+
+class SiteExport:
+    """
+    Writes many portfolios into one static site, either a directory tree or a single ZIP (dest ending
+    in .zip): <slug>/index.html per candidate, with shared files such as theme CSS and fonts stored
+    once under content-hashed names in assets/. Size therefore grows with the number of distinct
+    themes and assets, not the number of candidates, and hashed names can be cached forever.
+    """
+    def __init__(self, dest):
+        self.dest = dest
+        self.archive = dest.lower().endswith(".zip")
+        self.stats = {"pages": 0, "assets": 0, "bytes": 0, "deduplicated_bytes": 0}
+        self._assets = set()
+        self._slugs = set()
+        if self.archive:
+            os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+            self._zip = zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED)
+        else:
+            os.makedirs(dest, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.archive:
+            self._zip.close()
+
+    def _write(self, name, content):
+        if self.archive:
+            self._zip.writestr(name, content, compress_type=_compress_type(name))
+        else:
+            path = os.path.join(self.dest, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        self.stats["bytes"] += len(content)
+
+    def _asset(self, name, content):
+        asset = f"{ASSET_DIR}/{hashed_name(name, content)}"
+        if asset in self._assets:
+            self.stats["deduplicated_bytes"] += len(content)
+        else:
+            self._assets.add(asset)
+            self._write(asset, content)
+            self.stats["assets"] += 1
+        return asset
+
+    def add(self, name, files):
+        """
+        Adds one portfolio ({file name: bytes}, as from render_artifacts/optimize_site) under a unique
+        slug derived from name. Returns the page path relative to the site root.
+        """
+        slug = base = _slug(name)
+        n = 1
+        while slug in self._slugs:
+            n += 1
+            slug = f"{base}-{n}"
+        self._slugs.add(slug)
+
+        files = {f: c[1] if isinstance(c, tuple) else c for f, c in files.items()}
+        html = files["index.html"].decode("utf-8")
+        for file, content in files.items():
+            if file == "index.html":
+                continue
+            if is_shared(file):
+                url = f"../{self._asset(file, content)}"
+                html = html.replace(f'"{file}"', f'"{url}"').replace(f"url({file})", f"url({url})")
+            else:
+                self._write(f"{slug}/{file}", content)
+        self._write(f"{slug}/index.html", html.encode("utf-8"))
+        self.stats["pages"] += 1
+        return f"{slug}/index.html"
+
+    def add_root(self, name, content):
+        """
+        Writes a file at the site root, e.g. a cohort index.html linking the pages.
+        """
+        self._write(name, content.encode("utf-8") if isinstance(content, str) else content)
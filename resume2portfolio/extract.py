@@ -0,0 +1,270 @@
+import os
+import re
+
+from .ocr import is_image_only
+from .layout import page_lines, text_lines, lines_text, segment, sections_of
+from .taxonomy import get_taxonomy
+
+# ---------- Resume Text Extraction ----------
+MAX_PAGES = 20
+MAX_TEXT_CHARS = 200_000
+MAX_FILE_BYTES = 20 * 1024 * 1024
+
+def _open_pdf(source, max_file_bytes=MAX_FILE_BYTES):
+    """
+    Opens a PDF from a path (MuPDF reads the file itself; it is never loaded into a Python bytes
+    object), raw bytes, or a file-like upload, refusing anything over max_file_bytes.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        size = os.path.getsize(source)
+    elif isinstance(source, (bytes, bytearray)):
+        size = len(source)
+    elif hasattr(source, "getbuffer"):
+        size = source.getbuffer().nbytes
+    else:
+        source = source.read()
+        size = len(source)
+    if max_file_bytes and size > max_file_bytes:
+        raise ValueError(f"PDF is {size:,} bytes; the limit is {max_file_bytes:,} bytes.")
+    import fitz  # deferred: PyMuPDF is the slowest import in the package
+
+    if isinstance(source, (str, os.PathLike)):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+def _ocr_pages(doc, max_pages, ocr):
+    # Queue OCR for every image-only page up front so the pool works on them in parallel,
+    # then hand the texts back in page order.
+    items = []
+    for i, page in enumerate(doc):
+        if max_pages and i >= max_pages:
+            break
+        text = page.get_text()
+        items.append(ocr.submit(page) if is_image_only(page, text) else text)
+    for item in items:
+        yield item if isinstance(item, str) else ocr.result(item)
+
+def _text_pages(doc, max_pages):
+    for i, page in enumerate(doc):
+        if max_pages and i >= max_pages:
+            break
+        yield page.get_text()
+
+def iter_pdf_pages(source, max_pages=MAX_PAGES, max_chars=MAX_TEXT_CHARS, max_file_bytes=MAX_FILE_BYTES, ocr=None):
+    """
+    Lazily yields the text of each page, stopping after max_pages pages or max_chars characters.
+    Callers that stop iterating early never touch the remaining pages. With an OcrEngine, pages
+    that only contain images are OCRed instead of coming back empty.
+    """
+    with _open_pdf(source, max_file_bytes) as doc:
+        remaining = max_chars
+        pages = _ocr_pages(doc, max_pages, ocr) if ocr is not None else _text_pages(doc, max_pages)
+        for text in pages:
+            if max_chars:
+                text = text[:remaining]
+                remaining -= len(text)
+            yield text
+            if max_chars and remaining <= 0:
+                break
+
+def extract_pdf_text(file, max_pages=MAX_PAGES, max_chars=MAX_TEXT_CHARS, max_file_bytes=MAX_FILE_BYTES, ocr=None):
+    return "".join(iter_pdf_pages(file, max_pages, max_chars, max_file_bytes, ocr))
+
+def _layout_pages(doc, max_pages, ocr):
+    # Same up-front OCR queueing as _ocr_pages, but keeping font metadata for pages with a text layer.
+    items = []
+    for i, page in enumerate(doc):
+        if max_pages and i >= max_pages:
+            break
+        lines = page_lines(page, i)
+        if ocr is not None and is_image_only(page, lines_text(lines)):
+            items.append(ocr.submit(page))
+        else:
+            items.append(lines)
+    for i, item in enumerate(items):
+        yield item if isinstance(item, list) else text_lines(ocr.result(item), i)
+
+def extract_pdf_lines(source, max_pages=MAX_PAGES, max_chars=MAX_TEXT_CHARS, max_file_bytes=MAX_FILE_BYTES, ocr=None):
+    """
+    Returns the resume's layout Lines (text plus font size, boldness and position) in reading order,
+    with the same page, character and size limits as iter_pdf_pages.
+    """
+    out = []
+    with _open_pdf(source, max_file_bytes) as doc:
+        remaining = max_chars
+        for lines in _layout_pages(doc, max_pages, ocr):
+            for line in lines:
+                if max_chars:
+                    line.text = line.text[:remaining]
+                    remaining -= len(line.text) + 1
+                out.append(line)
+                if max_chars and remaining <= 0:
+                    return out
+    return out
+
+# Bump whenever extraction output changes so cached results are invalidated.
+EXTRACTOR_VERSION = 5
+
+# ---------- Compiled Patterns & Vocabularies ----------
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_RE = re.compile(r"\+?\d[\d -]{8,}\d")
+LINKEDIN_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/[^\s]+")
+GITHUB_RE = re.compile(r"https?://(?:www\.)?github\.com/[^\s]+")
+
+EDUCATION_KEYWORDS = ["b.tech","btech","diploma","ssc","hsc","university","college","bachelor","master","phd"]
+CERT_KEYWORDS = ["certified", "certification", "certificate", "licence", "award"]
+
+MAX_EDUCATION = 4
+MAX_CERTIFICATIONS = 5
+MAX_PROJECTS = 4
+PROJECT_WINDOW = 35
+
+# ---------- Single-Pass Extraction Engine ----------
+def split_lines(text):
+    return [l.strip() for l in text.split("\n") if l.strip()]
+
+def _first(pattern, text):
+    m = pattern.search(text)
+    return m.group(0) if m else ""
+
+def _name_from_lines(lines):
+    if not lines: return "Your Name"
+    c = lines[0]
+    lc = c.lower()
+    if "@" in c or "linkedin" in lc or "github" in lc:
+        return lines[1] if len(lines)>1 else "Your Name"
+    return c[:40]
+
+def _keyword_lines(lines, keywords, limit, max_len=None):
+    out = []
+    for l in lines:
+        low = l.lower()
+        if (max_len is None or len(l) < max_len) and any(k in low for k in keywords):
+            out.append(l)
+            if len(out) >= limit:
+                break
+    return out
+
+def _strip_bullet(text):
+    return text.lstrip("•●▪◦‣–-*· ").strip()
+
+def _education(sections, lines):
+    body = [l.text for l in sections_of(sections, "education")]
+    if not body:
+        return _keyword_lines(lines, EDUCATION_KEYWORDS, MAX_EDUCATION)
+    return _keyword_lines(body, EDUCATION_KEYWORDS, MAX_EDUCATION) or [l for l in body if len(l) < 100][:MAX_EDUCATION]
+
+def _certifications(sections, lines):
+    body = [_strip_bullet(l.text) for l in sections_of(sections, "certifications")]
+    if not body:
+        return _keyword_lines(lines, CERT_KEYWORDS, MAX_CERTIFICATIONS, max_len=100)
+    return [l for l in body if l and len(l) < 100][:MAX_CERTIFICATIONS]
+
+def _projects_by_window(lines):
+    # No projects heading: take short lines in the window after the first mention of "project".
+    projects = []
+    start = next((i for i, l in enumerate(lines) if "project" in l.lower()), None)
+    if start is None:
+        return projects
+    for l in lines[start + 1:start + PROJECT_WINDOW]:
+        if "project" not in l.lower() and 6 < len(l) < 80:
+            projects.append({"name":l,"desc":"Project description extracted from resume.","tech":""})
+            if len(projects) >= MAX_PROJECTS:
+                break
+    return projects
+
+TECH_PREFIXES = ("tech", "stack", "built with", "tools")
+
+def _projects(sections, lines):
+    """
+    Project entries from the projects sections: titles are bold lines (when body text is not bold)
+    or short unbulleted lines; bullets and wrapped sentences below a title become its description.
+    """
+    body = sections_of(sections, "projects")
+    if not body:
+        return _projects_by_window(lines)
+    bold_titles = any(l.bold for l in body) and not all(l.bold for l in body)
+    projects = []
+    for l in body:
+        text = _strip_bullet(l.text)
+        bulleted = text != l.text
+        continuation = text[:1].islower()
+        if bold_titles:
+            is_title = l.bold
+        else:
+            # Bulleted lines are descriptions, unless the section opens with one.
+            is_title = ((not bulleted or not projects) and not continuation
+                        and 6 < len(text) < 80 and not text.endswith("."))
+        if is_title and not text.lower().startswith(TECH_PREFIXES):
+            if len(projects) >= MAX_PROJECTS:
+                break
+            projects.append({"name":text,"desc":"","tech":""})
+        elif projects:
+            current = projects[-1]
+            low = text.lower()
+            if low.startswith(TECH_PREFIXES) and ":" in text:
+                current["tech"] = text.split(":", 1)[1].strip()
+            elif continuation and current["desc"]:
+                current["desc"] += " " + text
+            elif not current["desc"]:
+                current["desc"] = text
+    for p in projects:
+        p["desc"] = p["desc"] or "Project description extracted from resume."
+    return projects
+
+def _name(sections, lines):
+    # With font metadata the name is the largest line in the header; otherwise the first line.
+    header = [l for l in sections[0].lines if l.size] if sections and sections[0].kind == "header" else []
+    candidates = [l for l in header if "@" not in l.text and "http" not in l.text.lower()]
+    if candidates:
+        return max(candidates, key=lambda l: l.size).text[:40]
+    return _name_from_lines(lines)
+
+def extract_fields(text, sections=None):
+    """
+    Extracts every resume field from the section tree (built from the text when not given),
+    with one tokenisation pass for skills and contact details. Skills come ranked by taxonomy score.
+    Returns the raw extracted values, without the placeholder defaults applied by build_profile.
+    """
+    if sections is None:
+        sections = segment(text_lines(text))
+    lines = split_lines(text)
+    return {
+        "name": _name(sections, lines),
+        "email": _first(EMAIL_RE, text),
+        "phone": _first(PHONE_RE, text),
+        "linkedin": _first(LINKEDIN_RE, text),
+        "github": _first(GITHUB_RE, text),
+        "skills": get_taxonomy().rank(text),
+        "projects": _projects(sections, lines),
+        "education": _education(sections, lines),
+        "certifications": _certifications(sections, lines),
+    }
+
+# ---------- Individual Extractors ----------
+def find_email(text):
+    return _first(EMAIL_RE, text)
+
+def find_phone(text):
+    return _first(PHONE_RE, text)
+
+def find_linkedin(text):
+    return _first(LINKEDIN_RE, text)
+
+def find_github(text):
+    return _first(GITHUB_RE, text)
+
+def guess_name(text):
+    return _name_from_lines(split_lines(text))
+
+def extract_skills(text):
+    return get_taxonomy().rank(text)
+
+def extract_education(text):
+    return _education(segment(text_lines(text)), split_lines(text))
+
+def extract_certifications(text):
+    return _certifications(segment(text_lines(text)), split_lines(text))
+
+def extract_projects(text):
+    return _projects(segment(text_lines(text)), split_lines(text))
@@ -0,0 +1,198 @@
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .portfolio import pick_theme, profile_from_fields, render_artifacts, package_portfolio
+from .assets import optimize_site
+from .metrics import METRICS, profiled
+
+# ---------- Background Job Queue ----------
+class JobCancelled(Exception):
+    pass
+
+class JobLimitError(RuntimeError):
+    pass
+
+class Job:
+    """
+    One queued unit of work. The job function reports progress through advance(), which is also
+    where cancellation (explicit, or because the owner stopped polling) takes effect.
+    """
+    def __init__(self, owner, abandon_after=None):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.status = "queued"
+        self.stage = "Queued"
+        self.progress = 0
+        self.timings = {}
+        self.result = None
+        self.error = None
+        self.created = self.last_seen = time.monotonic()
+        self.finished = None
+        self.abandon_after = abandon_after
+        self.future = None
+        self._cancel = threading.Event()
+        self._stage_started = None
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def active(self):
+        return not self.done and not self._cancel.is_set()
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self.status = "cancelled"
+
+    def cancelled(self):
+        if self.abandon_after and time.monotonic() - self.last_seen > self.abandon_after:
+            self._cancel.set()
+        return self._cancel.is_set()
+
+    def advance(self, stage, progress):
+        self._end_stage()
+        if self.cancelled():
+            raise JobCancelled(self.id)
+        self.stage, self.progress = stage, progress
+        self._stage_started = time.perf_counter()
+
+    def _end_stage(self):
+        if self._stage_started is not None:
+            self.timings[self.stage] = round(time.perf_counter() - self._stage_started, 4)
+            self._stage_started = None
+
+class JobQueue:
+    """
+    Runs jobs on a local thread pool and keeps an in-memory job table.
+    max_per_owner bounds how many unfinished jobs one session may hold at once. Results can be large
+    (PDF bytes, rendered files, the search index), so finished jobs are kept only until claimed with
+    release(), and at most keep_finished of them for up to keep_for seconds.
+    """
+    def __init__(self, max_workers=2, max_per_owner=1, abandon_after=30, keep_finished=16, keep_for=120):
+        self.max_per_owner = max_per_owner
+        self.abandon_after = abandon_after
+        self.keep_finished = keep_finished
+        self.keep_for = keep_for
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="r2p-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, owner, fn, *args, **kwargs):
+        job = Job(owner, self.abandon_after)
+        with self._lock:
+            active = sum(1 for j in self._jobs.values() if j.owner == owner and j.active)
+            if self.max_per_owner and active >= self.max_per_owner:
+                raise JobLimitError(f"{owner} already has {active} job(s) in progress.")
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def release(self, job_id):
+        """
+        Drops a job from the table once its owner has taken the result.
+        """
+        with self._lock:
+            return self._jobs.pop(job_id, None)
+
+    def waiting(self):
+        """
+        Number of unfinished jobs that have not started real work yet.
+        """
+        with self._lock:
+            return sum(1 for j in self._jobs.values() if j.status == "queued" and j.active)
+
+    def position(self, job):
+        """
+        1-based place of a queued job in line (submission order), or 0 once it is running or done.
+        """
+        if job.status != "queued":
+            return 0
+        with self._lock:
+            ahead = 0
+            for j in self._jobs.values():
+                if j is job:
+                    return ahead + 1
+                if j.status == "queued" and j.active:
+                    ahead += 1
+        return 0
+
+    def cancel_owner(self, owner):
+        with self._lock:
+            jobs = [j for j in self._jobs.values() if j.owner == owner and not j.done]
+        for job in jobs:
+            job.cancel()
+
+    def _run(self, job, fn, args, kwargs):
+        if job.cancelled():
+            job.status = "cancelled"
+            return
+        job.status = "running"
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job._end_stage()
+            job.stage, job.progress, job.status = "Done", 100, "done"
+        except JobCancelled:
+            job._end_stage()
+            job.status = "cancelled"
+        except Exception as e:
+            job._end_stage()
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "failed"
+        job.finished = time.monotonic()
+        with self._lock:
+            self._prune()
+
+    def _prune(self):
+        # Unclaimed results (the session went away) expire after keep_for seconds
+        now = time.monotonic()
+        finished = [j.id for j in self._jobs.values() if j.done]
+        expired = [i for i in finished if now - (self._jobs[i].finished or now) > self.keep_for]
+        for job_id in set(expired) | set(finished[:max(0, len(finished) - self.keep_finished)]):
+            del self._jobs[job_id]
+
+# ---------- Portfolio Generation Job ----------
+def generation_job(job, cache, pdf_bytes, theme_choice, role, previous_artifacts=None, optimize=True, store=None,
+                   pdf_key=None):
+    """
+    With an ArtifactStore, the optimized files and ZIP are saved there and only their build_id is
+    returned; otherwise the result carries them as "files" and "zip_bytes". Pass pdf_key when the
+    caller already has cache_key(pdf_bytes), so the upload is not hashed again.
+    """
+    with METRICS.collect() as stages, profiled("generation"):
+        job.advance("📄 Extracting resume data...", 25)
+        text, fields, index = cache.get_or_extract_indexed(pdf_bytes, pdf_key)
+
+        job.advance("🧠 Analyzing skills and projects...", 50)
+        data = profile_from_fields(fields, role, pick_theme(theme_choice))
+
+        job.advance("🎨 Applying premium theme & building HTML...", 75)
+        artifacts = render_artifacts(data, pdf_bytes, previous_artifacts, pdf_key)
+
+        # Raw artifacts are kept for incremental reuse and preview; the optimized files are what ships.
+        # No .gz/.br siblings here: they only pay off on a static host and would bloat the download.
+        files = {name: content for name, (_, content) in artifacts.items()}
+        if optimize:
+            files = optimize_site(files, data.theme, compress=False)
+
+        job.advance("📦 Packaging ZIP...", 90)
+        zip_bytes = package_portfolio(files)
+        build_id = store.put(files, zip_bytes) if store is not None else None
+
+    result = {"data": data, "text": text, "index": index, "artifacts": artifacts, "build_id": build_id, "stages": stages}
+    if store is None:
+        result.update(files=files, zip_bytes=zip_bytes)
+    return result
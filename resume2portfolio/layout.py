@@ -0,0 +1,168 @@
+import re
+from collections import Counter
+
+# ---------- Layout Lines ----------
+# fitz.TEXT_PRESERVE_LIGATURES | TEXT_PRESERVE_WHITESPACE | TEXT_MEDIABOX_CLIP, spelled out so
+# importing this module does not load PyMuPDF
+TEXT_FLAGS = 1 | 2 | 64
+BOLD_FLAG = 16
+COLUMN_GUTTER = 12
+MIN_RIGHT_COLUMN_SHARE = 0.25
+
+class Line:
+    """
+    One visual line of a resume: its text plus the font metadata used to spot headings.
+    Lines recovered from plain text (OCR, pasted text) have size 0 and no styling.
+    """
+    __slots__ = ("text", "size", "bold", "x0", "y0", "x1", "page")
+
+    def __init__(self, text, size=0.0, bold=False, x0=0.0, y0=0.0, x1=0.0, page=0):
+        self.text = text
+        self.size = size
+        self.bold = bold
+        self.x0, self.y0, self.x1 = x0, y0, x1
+        self.page = page
+
+    def __repr__(self):
+        return f"Line({self.text!r}, size={self.size}, bold={self.bold})"
+
+def _reading_order(lines, width):
+    """
+    Sorts lines top-to-bottom, reading the left column fully before the right one when the page
+    is laid out in two columns (enough lines start right of centre and the left ones stop short of it).
+    """
+    mid = width / 2
+    right = [l for l in lines if l.x0 >= mid - COLUMN_GUTTER]
+    left = [l for l in lines if l.x0 < mid - COLUMN_GUTTER]
+    two_column = (len(right) >= MIN_RIGHT_COLUMN_SHARE * len(lines) and left
+                  and sum(l.x1 <= mid + COLUMN_GUTTER for l in left) >= 0.8 * len(left))
+    if two_column:
+        return sorted(lines, key=lambda l: (l.x0 >= mid - COLUMN_GUTTER, round(l.y0), l.x0))
+    return sorted(lines, key=lambda l: (round(l.y0), l.x0))
+
+def page_lines(page, page_no=0):
+    """
+    Returns the page's lines in reading order from a single get_text("dict") call.
+    """
+    lines = []
+    for block in page.get_text("dict", flags=TEXT_FLAGS)["blocks"]:
+        for line in block.get("lines", ()):
+            spans = [s for s in line["spans"] if s["text"].strip()]
+            if not spans:
+                continue
+            text = "".join(s["text"] for s in line["spans"]).strip()
+            x0, y0, x1, _ = line["bbox"]
+            lines.append(Line(text, round(max(s["size"] for s in spans), 1),
+                              all(s["flags"] & BOLD_FLAG or "bold" in s["font"].lower() for s in spans),
+                              x0, y0, x1, page_no))
+    return _reading_order(lines, page.rect.width)
+
+def text_lines(text, page_no=0):
+    return [Line(l.strip(), page=page_no) for l in text.split("\n") if l.strip()]
+
+def lines_text(lines):
+    return "\n".join(l.text for l in lines)
+
+# ---------- Section Tree ----------
+# Whole headings per section kind; a heading may also add up to two QUALIFIERS ("Academic Projects").
+SECTION_HEADINGS = [
+    ("projects", ("projects", "project", "project experience", "project work")),
+    ("certifications", ("certifications", "certification", "certificates", "licenses", "licences",
+                        "licenses and certifications", "certifications and licenses", "awards", "honors",
+                        "honours", "achievements", "accomplishments", "awards and achievements",
+                        "honors and awards", "certifications and awards")),
+    ("education", ("education", "educational background", "academic background", "academics",
+                   "qualifications", "academic qualifications", "educational qualifications",
+                   "education and training")),
+    ("experience", ("experience", "employment", "employment history", "work history", "internships",
+                    "internship", "internship experience", "work experience")),
+    ("skills", ("skills", "skill set", "skillset", "technologies", "tools", "tools and technologies",
+                "tech stack", "competencies", "core competencies", "technical proficiency")),
+    ("summary", ("summary", "objective", "career objective", "profile", "about me", "about")),
+    ("contact", ("contact", "contact information", "contact details")),
+]
+HEADING_QUALIFIERS = frozenset(("academic", "personal", "key", "selected", "relevant", "professional",
+                                "technical", "major", "notable", "other", "additional", "core", "my"))
+_HEADING_KINDS = {phrase: kind for kind, phrases in SECTION_HEADINGS for phrase in phrases}
+MAX_HEADING_WORDS = 4
+MAX_HEADING_CHARS = 40
+HEADING_SIZE_RATIO = 1.12
+
+class Section:
+    """
+    A resume section: the heading line (None for the header above the first heading), its kind
+    from SECTION_HEADINGS ("header" / "other" when unrecognised) and its body lines.
+    """
+    __slots__ = ("kind", "heading", "lines")
+
+    def __init__(self, kind, heading=None):
+        self.kind = kind
+        self.heading = heading
+        self.lines = []
+
+    def __repr__(self):
+        return f"Section({self.kind!r}, {self.heading.text if self.heading else None!r}, {len(self.lines)} lines)"
+
+def section_kind(text):
+    """
+    Classifies a line that is a whole section heading ("Projects", "Academic Projects:"), or returns None.
+    "Inventory Management Project" is a project title, not a heading.
+    """
+    text = text.strip().rstrip(":").strip()
+    if not text or len(text) > MAX_HEADING_CHARS or len(text.split()) > MAX_HEADING_WORDS:
+        return None
+    words = re.sub(r"[^a-z& ]", " ", text.lower()).replace("&", " and ").split()
+    for i in range(min(3, len(words))):
+        if i and words[i - 1] not in HEADING_QUALIFIERS:
+            break
+        kind = _HEADING_KINDS.get(" ".join(words[i:]))
+        if kind is not None:
+            return kind
+    return None
+
+def _style(line):
+    return (round(line.size), line.bold, line.text.isupper())
+
+def _body_style(lines):
+    # Most common (size, bold) weighted by characters is the body text style.
+    weights = Counter()
+    for l in lines:
+        weights[(round(l.size * 2) / 2, l.bold)] += len(l.text)
+    return weights.most_common(1)[0][0] if weights else (0.0, False)
+
+def _looks_like_heading(line, body_size):
+    # Bold alone is not enough: project and job titles are often bold at body size.
+    if line.size:
+        return (line.size >= body_size * HEADING_SIZE_RATIO
+                or (line.text.isupper() and any(c.isalpha() for c in line.text)))
+    # Plain text: no font metadata, so rely on how headings are usually typed.
+    text = line.text.strip()
+    return text.isupper() or text.endswith(":") or len(re.findall(r"[A-Za-z]+", text)) <= 2
+
+def segment(lines):
+    """
+    Groups lines into a flat section tree in one pass, once the body font style is known.
+    A line opens a section when it is styled like a heading (larger than the body, or all caps) and is
+    a whole known heading; unrecognised lines only do so if they share the style of a recognised
+    heading. A heading of the kind already open stays in its body, so its style never marks titles
+    within the section as headings.
+    """
+    body_size, _ = _body_style(lines)
+    sections = [Section("header")]
+    heading_styles = set()
+    for line in lines:
+        if _looks_like_heading(line, body_size):
+            kind = section_kind(line.text)
+            if kind is not None and kind != sections[-1].kind:
+                heading_styles.add(_style(line))
+                sections.append(Section(kind, line))
+                continue
+            if (kind is None and line.size and _style(line) in heading_styles
+                    and len(line.text) <= MAX_HEADING_CHARS):
+                sections.append(Section("other", line))
+                continue
+        sections[-1].lines.append(line)
+    return sections
+
+def sections_of(sections, kind):
+    return [l for s in sections if s.kind == kind for l in s.lines]
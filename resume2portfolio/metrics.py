@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import cProfile
+import threading
+import tracemalloc
+from functools import wraps
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_DIR = os.environ.get("R2P_PROFILE_DIR")
+
+# ---------- Per-Stage Pipeline Metrics ----------
+def _max_rss():
+    if resource is None:
+        return 0
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+class StageMetrics:
+    """
+    Aggregates wall time, CPU time, peak memory and byte counts per pipeline stage.
+    Peak memory is the tracemalloc peak during the stage when tracing is on, otherwise process max RSS.
+    Stages may nest (qr inside render): an enclosing stage reports its own wall and CPU time without
+    its inner stages, so per-stage times add up, while its peak memory still covers them.
+    """
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self, name):
+        rec = {"bytes": 0}
+        stack = self._local.__dict__.setdefault("stack", [])
+        parent = stack[-1] if stack else None
+        frame = {"peak": 0, "child_wall": 0.0, "child_cpu": 0.0}
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            if parent is not None:
+                # reset_peak() below would lose the enclosing stage's peak so far
+                parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        stack.append(frame)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield rec
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            stack.pop()
+            rec["wall"] = wall - frame["child_wall"]
+            rec["cpu"] = cpu - frame["child_cpu"]
+            if tracing:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                rec["peak_mem"] = peak - base
+            else:
+                rec["peak_mem"] = _max_rss()
+            if parent is not None:
+                parent["child_wall"] += wall
+                parent["child_cpu"] += cpu
+                if tracing:
+                    parent["peak"] = max(parent["peak"], peak)
+            self._observe(name, rec)
+
+    @contextmanager
+    def collect(self):
+        """
+        Collects {stage: record} for every stage run on this thread inside the block (one request).
+        """
+        sink = {}
+        self._local.sink = sink
+        try:
+            yield sink
+        finally:
+            self._local.sink = None
+
+    def _observe(self, name, rec):
+        sink = getattr(self._local, "sink", None)
+        if sink is not None:
+            sink[name] = rec
+        with self._lock:
+            s = self._stats.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "bytes": 0, "wall_max": 0.0, "peak_mem": 0})
+            s["calls"] += 1
+            s["wall"] += rec["wall"]
+            s["cpu"] += rec["cpu"]
+            s["bytes"] += rec["bytes"]
+            s["wall_max"] = max(s["wall_max"], rec["wall"])
+            s["peak_mem"] = max(s["peak_mem"], rec["peak_mem"])
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(s) for name, s in self._stats.items()}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        series = [
+            ("r2p_stage_calls_total", "counter", "Number of times each pipeline stage ran.", "calls"),
+            ("r2p_stage_seconds_total", "counter", "Wall time spent in each pipeline stage.", "wall"),
+            ("r2p_stage_cpu_seconds_total", "counter", "CPU time spent in each pipeline stage.", "cpu"),
+            ("r2p_stage_bytes_total", "counter", "Bytes produced or consumed by each pipeline stage.", "bytes"),
+            ("r2p_stage_max_seconds", "gauge", "Slowest single run of each pipeline stage.", "wall_max"),
+            ("r2p_stage_peak_memory_bytes", "gauge", "Peak memory observed during each pipeline stage.", "peak_mem"),
+        ]
+        stats = self.snapshot()
+        lines = []
+        for metric, kind, help_text, key in series:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, s in sorted(stats.items()):
+                lines.append(f'{metric}{{stage="{name}"}} {s[key]}')
+        return "\n".join(lines) + "\n"
+
+METRICS = StageMetrics()
+
+def timed(name, size=None):
+    """
+    Decorator that runs the function as a METRICS stage; size(result, *args) gives its byte count.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with METRICS.stage(name) as rec:
+                result = fn(*args, **kwargs)
+                if size is not None:
+                    rec["bytes"] = size(result, *args)
+                return result
+        return wrapper
+    return decorator
+
+# ---------- Optional Per-Request Profiling ----------
+_profile_lock = threading.Lock()
+
+@contextmanager
+def profiled(label, profile_dir=None):
+    """
+    When R2P_PROFILE_DIR (or profile_dir) is set, dumps a cProfile .prof file and the top
+    tracemalloc allocation sites for the block. Only one request is profiled at a time.
+    """
+    profile_dir = profile_dir or PROFILE_DIR
+    if not profile_dir or not _profile_lock.acquire(blocking=False):
+        yield
+        return
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    prof = cProfile.Profile()
+    try:
+        prof.enable()
+        yield
+    finally:
+        prof.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        _profile_lock.release()
+        os.makedirs(profile_dir, exist_ok=True)
+        stem = os.path.join(profile_dir, f"{label}-{time.strftime('%Y%m%d_%H%M%S')}-{threading.get_ident()}")
+        prof.dump_stats(f"{stem}.prof")
+        with open(f"{stem}.mem.txt", "w", encoding="utf-8") as f:
+            for stat in snapshot.statistics("lineno")[:25]:
+                f.write(f"{stat}\n")
+
+# ---------- Metrics Endpoint ----------
+def _metrics_handler():
+    # http.server is only imported when the endpoint is enabled.
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/metrics.json"):
+                body, ctype = METRICS.to_json(), "application/json"
+            elif self.path.startswith("/metrics"):
+                body, ctype = METRICS.to_prometheus(), "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return MetricsHandler
+
+def serve_metrics(port, host="0.0.0.0"):
+    """
+    Serves /metrics (Prometheus text) and /metrics.json from a daemon thread.
+    """
+    from http.server import ThreadingHTTPServer
+
+    server = ThreadingHTTPServer((host, port), _metrics_handler())
+    threading.Thread(target=server.serve_forever, name="r2p-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,145 @@
+import sys
+import json
+from dataclasses import dataclass, fields as dataclass_fields
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used without it
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: the binary format falls back to compact JSON bytes
+    msgpack = None
+
+# ---------- Fast Serialisation ----------
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+_MSGPACK, _JSON = b"M", b"J"
+
+def dumps_json(obj, pretty=False, sort_keys=False):
+    """
+    JSON as UTF-8 bytes, through orjson when installed. pretty gives the 2-space indented form.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+
+def loads_json(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def pack(obj):
+    """
+    Compact binary encoding for internal caches and worker results: msgpack when installed,
+    otherwise compact JSON. A one-byte tag records which, so either side can read the other's output.
+    """
+    if msgpack is not None:
+        return _MSGPACK + msgpack.packb(obj, use_bin_type=True)
+    return _JSON + dumps_json(obj)
+
+def unpack(data):
+    tag, body = data[:1], data[1:]
+    if tag == _MSGPACK:
+        if msgpack is None:
+            raise ValueError("Data was packed with msgpack, which is not installed.")
+        return msgpack.unpackb(body, raw=False)
+    if tag == _JSON:
+        return loads_json(body)
+    raise ValueError(f"Unknown pack format {tag!r}.")
+
+# ---------- Profile Model ----------
+@dataclass(frozen=True, **_SLOTS)
+class Theme:
+    name: str
+    bg: str
+    card: str
+    text: str
+    accent1: str
+    accent2: str
+    accent3: str
+    font_heading: str
+    font_body: str
+
+    def to_dict(self):
+        return {f.name: getattr(self, f.name) for f in dataclass_fields(self)}
+
+@dataclass(frozen=True, **_SLOTS)
+class Project:
+    name: str
+    desc: str = ""
+    tech: str = ""
+
+    def to_dict(self):
+        return {"name": self.name, "desc": self.desc, "tech": self.tech}
+
+@dataclass(frozen=True, **_SLOTS)
+class Profile:
+    """
+    Immutable template data for one portfolio. Lists are stored as tuples, so a Profile can be
+    shared between reruns, threads and cached builds without defensive copies.
+    """
+    name: str
+    title: str
+    summary: str
+    email: str
+    phone: str
+    linkedin: str
+    github: str
+    skills: tuple
+    projects: tuple
+    education: tuple
+    certifications: tuple
+    theme: Theme
+    has_resume: bool = True
+
+    @property
+    def font_heading(self):
+        return self.theme.font_heading.replace(" ", "+")
+
+    @property
+    def font_body(self):
+        return self.theme.font_body.replace(" ", "+")
+
+    def context(self, **extra):
+        """
+        Template variables: the profile's fields by name (Project objects stay as they are), plus extra.
+        """
+        ctx = {f.name: getattr(self, f.name) for f in dataclass_fields(self)}
+        ctx["font_heading"], ctx["font_body"] = self.font_heading, self.font_body
+        ctx.update(extra)
+        return ctx
+
+    def to_dict(self):
+        return {
+            "name": self.name, "title": self.title, "summary": self.summary,
+            "email": self.email, "phone": self.phone, "linkedin": self.linkedin, "github": self.github,
+            "skills": list(self.skills),
+            "projects": [p.to_dict() for p in self.projects],
+            "education": list(self.education),
+            "certifications": list(self.certifications),
+            "theme": self.theme.to_dict(),
+            "font_heading": self.font_heading, "font_body": self.font_body,
+            "has_resume": self.has_resume,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            name=d["name"], title=d["title"], summary=d["summary"],
+            email=d["email"], phone=d["phone"], linkedin=d["linkedin"], github=d["github"],
+            skills=tuple(d["skills"]),
+            projects=tuple(Project(p["name"], p.get("desc", ""), p.get("tech", "")) for p in d["projects"]),
+            education=tuple(d["education"]),
+            certifications=tuple(d["certifications"]),
+            theme=Theme(**d["theme"]),
+            has_resume=d.get("has_resume", True),
+        )
+
+    def pack(self):
+        return pack(self.to_dict())
+
+    @classmethod
+    def unpack(cls, data):
+        return cls.from_dict(unpack(data))
@@ -0,0 +1,139 @@
+import os
+import hashlib
+import threading
+from concurrent.futures import BrokenExecutor, CancelledError, TimeoutError as FutureTimeout
+
+# ---------- OCR Fallback For Scanned Pages ----------
+OCR_DPI = 300
+OCR_LANGUAGE = "eng"
+OCR_TIMEOUT = 60
+MIN_TEXT_CHARS = 20
+# Page OCR results get their own cache (see ExtractionCache.namespace) so a long scan cannot push
+# whole-resume entries out of the extraction LRU.
+PAGE_CACHE_NAMESPACE = "ocr-pages"
+PAGE_CACHE_ENTRIES = 1024
+PAGE_CACHE_DISK_BUDGET = 64 * 1024 * 1024
+
+def ocr_available():
+    """
+    True when PyMuPDF can locate a Tesseract installation (tessdata).
+    """
+    try:
+        import fitz
+        return bool(os.environ.get("TESSDATA_PREFIX") or fitz.get_tessdata())
+    except Exception:
+        return False
+
+def is_image_only(page, text=None):
+    text = page.get_text() if text is None else text
+    return len(text.strip()) < MIN_TEXT_CHARS and bool(page.get_images(full=False))
+
+def page_hash(page):
+    """
+    Content hash of a page from its raw image streams and drawing commands, computed without rendering.
+    """
+    h = hashlib.sha256(page.read_contents())
+    h.update(f"{page.rect}:{page.rotation}".encode())
+    for img in page.get_images(full=False):
+        h.update(page.parent.xref_stream_raw(img[0]) or b"")
+    return h.hexdigest()
+
+def _ocr_png(png_bytes, language=OCR_LANGUAGE):
+    # Runs in a worker process: wrap the rendered page in a one-page PDF with an OCR text layer.
+    import fitz
+
+    pix = fitz.Pixmap(png_bytes)
+    with fitz.open("pdf", pix.pdfocr_tobytes(language=language)) as doc:
+        return doc[0].get_text()
+
+class OcrEngine:
+    """
+    OCRs image-only pages in a bounded process pool. Each page is rendered once, hashed, and looked
+    up in `cache` (anything with get/put, e.g. an ExtractionCache namespace) before any OCR work is
+    queued. A task that overruns `timeout` cannot be interrupted, so its pool is killed and replaced;
+    other pages caught in that pool are resubmitted once. With max_workers=0 OCR runs inline in the
+    calling process and `timeout` is not enforced.
+    """
+    def __init__(self, max_workers=2, timeout=OCR_TIMEOUT, dpi=OCR_DPI, language=OCR_LANGUAGE, cache=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.dpi = dpi
+        self.language = language
+        self.cache = cache
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def signature(self):
+        return f"ocr-{self.language}-{self.dpi}"
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                from concurrent.futures import ProcessPoolExecutor  # pulls in multiprocessing; only for OCR
+
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _recycle(self, pool):
+        # Kills a pool stuck on a hung Tesseract run; the next submit starts a fresh one.
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        for proc in list((pool._processes or {}).values()):  # no public API to stop running tasks
+            proc.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _start(self, png):
+        pool = self._get_pool()
+        return pool, pool.submit(_ocr_png, png, self.language)
+
+    def submit(self, page):
+        """
+        Starts OCR for one page; returns a handle for result(). Cached pages resolve immediately
+        and are never rendered.
+        """
+        key = f"{page_hash(page)}-{self.signature}"
+        entry = self.cache.get(key) if self.cache is not None else None
+        if entry is not None:
+            return key, entry["text"]
+        png = page.get_pixmap(dpi=self.dpi).tobytes("png")
+        if not self.max_workers:
+            return key, self._store(key, self._safe_ocr(png))
+        return (key, png) + self._start(png)
+
+    def result(self, handle):
+        if isinstance(handle[1], str):
+            return handle[1]
+        key, png, pool, pending = handle
+        for attempt in range(2):
+            try:
+                return self._store(key, pending.result(timeout=self.timeout))
+            except FutureTimeout:
+                self._recycle(pool)
+                return ""
+            except (BrokenExecutor, CancelledError):
+                # Another page's timeout recycled the pool under this one: retry it once on a fresh pool
+                if attempt:
+                    return ""
+                pool, pending = self._start(png)
+            except Exception:
+                return ""
+        return ""
+
+    def _safe_ocr(self, png):
+        try:
+            return _ocr_png(png, self.language)
+        except Exception:
+            return ""
+
+    def _store(self, key, text):
+        if self.cache is not None and text:
+            self.cache.put(key, {"text": text})
+        return text
+
+    def shutdown(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
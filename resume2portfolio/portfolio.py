@@ -0,0 +1,187 @@
+import os
+import hashlib
+import zipfile
+import random
+from io import BytesIO
+
+from .extract import extract_fields
+from .metrics import METRICS, timed
+from .templating import get_template, template_digest
+from .qr import portfolio_url, qr_svg
+from .model import Theme, Project, Profile, dumps_json
+
+# ---------- Themes & Constants ----------
+THEMES = [
+    Theme(**{"name":"Aurora Pro","bg":"#0b1220","card":"rgba(255,255,255,0.06)","text":"#e5e7eb",
+     "accent1":"#2563eb","accent2":"#a855f7","accent3":"#ec4899","font_heading":"Poppins","font_body":"Inter"}),
+    Theme(**{"name":"Sunset Studio","bg":"#120a0a","card":"rgba(255,255,255,0.08)","text":"#fff7ed",
+     "accent1":"#f97316","accent2":"#fb7185","accent3":"#f59e0b","font_heading":"Montserrat","font_body":"Nunito"}),
+    Theme(**{"name":"Emerald Glass","bg":"#04120d","card":"rgba(255,255,255,0.07)","text":"#ecfdf5",
+     "accent1":"#22c55e","accent2":"#06b6d4","accent3":"#10b981","font_heading":"Space Grotesk","font_body":"DM Sans"}),
+    Theme(**{"name":"Mono Minimal","bg":"#070707","card":"rgba(255,255,255,0.07)","text":"#f4f4f5",
+     "accent1":"#ffffff","accent2":"#a1a1aa","accent3":"#71717a","font_heading":"IBM Plex Sans","font_body":"IBM Plex Sans"}),
+    Theme(**{"name":"Oceanic Depth","bg":"#0f172a","card":"rgba(255,255,255,0.05)","text":"#f1f5f9",
+     "accent1":"#38bdf8","accent2":"#818cf8","accent3":"#6366f1","font_heading":"Outfit","font_body":"Roboto"})
+]
+
+ROLES = ["AI/ML Developer", "Data Analyst", "Full Stack Developer", "Backend Engineer",
+         "Frontend Developer", "Cloud/DevOps Engineer", "Software Engineer"]
+
+RANDOM_THEME = "Random (Auto)"
+
+def pick_theme(theme_choice):
+    if theme_choice == RANDOM_THEME:
+        return random.choice(THEMES)
+    return [t for t in THEMES if t.name == theme_choice][0]
+
+def build_profile(text, role, theme):
+    """
+    Runs every extractor over the resume text and assembles the template Profile.
+    """
+    return profile_from_fields(extract_fields(text), role, theme)
+
+def profile_from_fields(fields, role, theme):
+    projects = fields["projects"] if fields["projects"] else [{"name":"Portfolio Project","desc":"Generated project.","tech":"Python"}]
+    return Profile(
+        name=fields["name"],
+        title=f"{role} | Portfolio",
+        summary="Professional portfolio generated using Resume2PortfolioAI Pro.",
+        email=fields["email"], phone=fields["phone"], linkedin=fields["linkedin"], github=fields["github"],
+        skills=tuple(fields["skills"] if fields["skills"] else ["Python", "Machine Learning", "SQL", "GitHub"]),
+        projects=tuple(Project(p["name"], p.get("desc", ""), p.get("tech", "")) for p in projects),
+        education=tuple(fields["education"] if fields["education"] else ["University Degree"]),
+        certifications=tuple(fields["certifications"] if fields["certifications"] else ["Certified Developer"]),
+        theme=theme,
+    )
+
+def generate_simple_faq(data):
+    """
+    Generates a simple FAQ list based on extracted data. Skills are ranked, so the first five are the strongest.
+    """
+    skills = ", ".join(data.skills[:5])
+    project = data.projects[0].name if data.projects else "various projects"
+    
+    faq = [
+        ("What are your top skills?", f"My core technical strengths include {skills}."),
+        ("Do you have project experience?", f"Yes! I have worked on projects like '{project}'. Check the Projects section for more."),
+        ("How can I contact you?", f"You can reach me via email at {data.email or 'provided in contact section'}."),
+        ("What is your educational background?", f"I studied {data.education[0] if data.education else 'Computer Science'}.")
+    ]
+    return faq
+
+def generate_css(theme):
+    return f"""
+/* Generated by Resume2PortfolioAI Pro */
+:root {{
+    --bg-color: {theme.bg};
+    --card-bg: {theme.card};
+    --text-color: {theme.text};
+    --accent-1: {theme.accent1};
+    --accent-2: {theme.accent2};
+    --accent-3: {theme.accent3};
+    --font-heading: '{theme.font_heading}', sans-serif;
+    --font-body: '{theme.font_body}', sans-serif;
+}}
+/* ... (Rest of CSS logic is handled in template, simplified here for brevity) ... */
+body {{ background-color: var(--bg-color); color: var(--text-color); font-family: var(--font-body); }}
+h1, h2, h3 {{ font-family: var(--font-heading); }}
+"""
+
+def _digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, (bytes, bytearray, memoryview)) else dumps_json(part, sort_keys=True))
+    return h.hexdigest()
+
+def _artifact_specs(data, pdf_bytes=None, pdf_key=None):
+    """
+    Returns {file name: (dependency hash, render function -> iterable of byte chunks)} for every
+    portfolio artifact. Nothing is rendered until the render function is called. pdf_key, when
+    given, stands in for hashing pdf_bytes.
+    """
+    template = get_template("index.html")
+    
+    # FAQ is derived per build; the caller's Profile is never modified
+    faq = generate_simple_faq(data)
+    portable = data.to_dict()
+    portable["faq"] = faq
+
+    specs = {
+        "index.html": (_digest(template_digest(template), portable),
+                       lambda: (chunk.encode("utf-8") for chunk in template.generate(**data.context(faq=faq)))),
+        "style.css": (_digest(data.theme.to_dict()), lambda: [generate_css(data.theme).encode("utf-8")]),
+        "data.json": (_digest(portable), lambda: [dumps_json(portable, pretty=True)]),
+    }
+    url = portfolio_url(data)
+    specs["qr.svg"] = (_digest(url), lambda: [qr_svg(url)])
+    if pdf_bytes:
+        specs["resume.pdf"] = (pdf_key or _digest(pdf_bytes), lambda: [pdf_bytes])
+    return specs
+
+def build_portfolio(output_dir, data, pdf_buffer=None):
+    """
+    Renders the portfolio into output_dir, streaming each file to disk, and returns the names written.
+    """
+    specs = _artifact_specs(data, pdf_buffer.getbuffer() if pdf_buffer else None)
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    with METRICS.stage("render_write") as rec:
+        for name, (_, render) in specs.items():
+            with open(os.path.join(output_dir, name), "wb") as f:
+                f.writelines(render())
+                rec["bytes"] += f.tell()
+            written.append(name)
+    return written
+
+def render_artifacts(data, pdf_bytes=None, previous=None, pdf_key=None):
+    """
+    In-memory counterpart of build_portfolio: returns {file name: (dependency hash, bytes)}.
+    Entries of `previous` whose dependency hash still matches are reused instead of re-rendered.
+    """
+    previous = previous or {}
+    artifacts = {}
+    with METRICS.stage("render") as rec:
+        for name, (dep, render) in _artifact_specs(data, pdf_bytes, pdf_key).items():
+            old = previous.get(name)
+            if old and old[0] == dep:
+                artifacts[name] = old
+            else:
+                artifacts[name] = (dep, b"".join(render()))
+                rec["bytes"] += len(artifacts[name][1])
+    return artifacts
+
+# Already-compressed formats gain nothing from deflate, so they are stored as-is.
+STORED_EXTENSIONS = (".pdf", ".png", ".jpg", ".jpeg", ".gz", ".br", ".zip", ".woff", ".woff2")
+
+# .gz/.br siblings from optimize_site are for static hosts; a ZIP would carry every file twice.
+PRECOMPRESSED_SUFFIXES = (".gz", ".br")
+
+def _compress_type(name):
+    return zipfile.ZIP_STORED if name.lower().endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+
+@timed("package", size=lambda result, *args: len(result))
+def package_portfolio(artifacts):
+    """
+    Packs rendered artifacts ({name: bytes} or {name: (dep, bytes)}) into a ZIP held in memory.
+    """
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in artifacts.items():
+            if name.endswith(PRECOMPRESSED_SUFFIXES):
+                continue
+            if isinstance(content, tuple):
+                content = content[1]
+            zf.writestr(name, content, compress_type=_compress_type(name))
+    return buf.getvalue()
+
+@timed("zip", size=lambda result, folder_path, zip_path: os.path.getsize(zip_path))
+def zip_folder(folder_path, zip_path):
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                if file.endswith(PRECOMPRESSED_SUFFIXES):
+                    continue
+                full_path = os.path.join(root, file)
+                rel_path = os.path.relpath(full_path, folder_path)
+                zf.write(full_path, arcname=rel_path, compress_type=_compress_type(file))
@@ -0,0 +1,67 @@
+from io import BytesIO
+from functools import lru_cache
+
+from .metrics import timed
+
+QR_CACHE_SIZE = 256
+PLACEHOLDER_GITHUB = "github.com/username"
+
+# ---------- QR Codes ----------
+def portfolio_url(data):
+    """
+    URL the portfolio QR code points at: the GitHub link from the resume, or a placeholder.
+    """
+    user_github = data.github if "github.com" in data.github else PLACEHOLDER_GITHUB
+    return user_github if "http" in user_github else f"https://{user_github}"
+
+def generate_qr_code(url, box_size=10, border=4):
+    import qrcode  # deferred along with PIL, which it loads to draw the image
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    return img
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+@timed("qr")
+def qr_png(url, box_size=10, border=4):
+    buf = BytesIO()
+    generate_qr_code(url, box_size, border).save(buf, format="PNG")
+    return buf.getvalue()
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def qr_matrix(url, border=4):
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_L, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return tuple(tuple(row) for row in qr.get_matrix())
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+@timed("qr")
+def qr_svg(url, box_size=10, border=4):
+    """
+    Renders the QR code as a single SVG path, one rectangle per run of dark modules. No PIL involved.
+    """
+    matrix = qr_matrix(url, border)
+    size = len(matrix) * box_size
+    path = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < len(row):
+            if row[x]:
+                start = x
+                while x < len(row) and row[x]:
+                    x += 1
+                path.append(f"M{start * box_size} {y * box_size}h{(x - start) * box_size}v{box_size}h-{(x - start) * box_size}z")
+            else:
+                x += 1
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+            f'<rect width="100%" height="100%" fill="#fff"/><path fill="#000" d="{"".join(path)}"/></svg>').encode("utf-8")
@@ -0,0 +1,80 @@
+import re
+import math
+
+from .extract import split_lines
+
+# ---------- "Ask About Me" Retrieval Index ----------
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset("""a an and are as at be by can do does for from has have how i in is it me my of on or
+so that the their them they this to was what when where which who why will with you your about tell""".split())
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+class ResumeIndex:
+    """
+    BM25 index over resume lines. Postings are stored column-wise (CSC layout) in NumPy arrays:
+    for term t, doc ids are indices[indptr[t]:indptr[t+1]] with precomputed BM25 weights in `weights`,
+    so a query is a handful of vectorised scatter-adds.
+    """
+    def __init__(self, lines, k1=1.5, b=0.75):
+        import numpy as np  # deferred until the first index is built
+
+        self.lines = lines
+        docs = [tokenize(l) for l in lines]
+        lengths = np.array([len(d) for d in docs], dtype=np.float32)
+        avg_len = float(lengths.mean()) if len(docs) and lengths.sum() else 1.0
+
+        postings = {}
+        for doc_id, tokens in enumerate(docs):
+            for tok in tokens:
+                counts = postings.setdefault(tok, {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        self.vocab = {}
+        indptr, indices, weights = [0], [], []
+        n = len(docs)
+        for term_id, (tok, counts) in enumerate(postings.items()):
+            self.vocab[tok] = term_id
+            ids = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            idf = math.log(1 + (n - len(counts) + 0.5) / (len(counts) + 0.5))
+            norm = tf + k1 * (1 - b + b * lengths[ids] / avg_len)
+            indices.append(ids)
+            weights.append((idf * tf * (k1 + 1) / norm).astype(np.float32))
+            indptr.append(indptr[-1] + len(ids))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+        self.weights = np.concatenate(weights) if weights else np.zeros(0, dtype=np.float32)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(split_lines(text))
+
+    def scores(self, query):
+        import numpy as np
+
+        scores = np.zeros(len(self.lines), dtype=np.float32)
+        for tok in set(tokenize(query)):
+            t = self.vocab.get(tok)
+            if t is not None:
+                lo, hi = self.indptr[t], self.indptr[t + 1]
+                scores[self.indices[lo:hi]] += self.weights[lo:hi]
+        return scores
+
+    def search(self, query, k=3):
+        """
+        Returns up to k (score, line) pairs, best first; lines with no matching terms are left out.
+        """
+        import numpy as np
+
+        scores = self.scores(query)
+        if not len(scores):
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(float(scores[i]), self.lines[i]) for i in top if scores[i] > 0]
+
+    def search_many(self, queries, k=3):
+        return [self.search(q, k) for q in queries]
@@ -0,0 +1,35 @@
+import sys
+import time
+
+from .templating import warm_templates
+from .taxonomy import get_taxonomy
+
+# ---------- Lazy Dependency Warm-Up ----------
+# Imported on first use by the modules that need them, never at package import
+HEAVY_MODULES = ("fitz", "qrcode", "PIL", "jinja2", "numpy")
+
+def loaded_heavy_modules():
+    return [m for m in HEAVY_MODULES if m in sys.modules]
+
+def _load_pymupdf():
+    import fitz
+    fitz.open().close()  # first document initialises MuPDF's context
+
+def _load_qr():
+    from .qr import qr_png, PLACEHOLDER_GITHUB
+    # Every resume without a GitHub link gets this QR code; rendering it also imports qrcode and PIL
+    qr_png(f"https://{PLACEHOLDER_GITHUB}")
+
+WARM_UP_STEPS = [("pymupdf", _load_pymupdf), ("templates", warm_templates), ("qr", _load_qr), ("taxonomy", get_taxonomy)]
+
+def warm_up():
+    """
+    Loads every lazily imported dependency and compiles the templates, so the first request does
+    not pay for them. Safe to call from a background thread. Returns {step: seconds}.
+    """
+    timings = {}
+    for name, step in WARM_UP_STEPS:
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings
@@ -0,0 +1,158 @@
+import time
+import sqlite3
+import threading
+
+from .templating import get_template
+from .model import Profile, dumps_json, loads_json
+
+# ---------- Multi-Resume Profile Store ----------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    pdf_key TEXT UNIQUE,
+    name TEXT NOT NULL,
+    email TEXT,
+    phone TEXT,
+    linkedin TEXT,
+    github TEXT,
+    path TEXT,
+    data TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS profile_skills (
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    PRIMARY KEY (skill_id, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_skills_by_profile ON profile_skills(profile_id);
+CREATE TABLE IF NOT EXISTS education (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS profile_education (
+    education_id INTEGER NOT NULL REFERENCES education(id),
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (education_id, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_education_by_profile ON profile_education(profile_id);
+"""
+
+class ProfileStore:
+    """
+    SQLite-backed store of extracted profiles. Skills and education entries are interned into
+    lookup tables and linked through (value, profile) indexes, so "has all of these skills"
+    queries touch only the matching postings instead of scanning every profile.
+    """
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    def _intern(self, table, values):
+        ids = []
+        for value in values:
+            self._conn.execute(f"INSERT OR IGNORE INTO {table}(name) VALUES (?)", (value,))
+            ids.append(self._conn.execute(f"SELECT id FROM {table} WHERE name = ?", (value,)).fetchone()[0])
+        return ids
+
+    def add(self, data, pdf_key=None, path=None, skills=None, education=None):
+        """
+        Inserts (or, for a known pdf_key, replaces) one profile built by profile_from_fields and
+        returns its id. pdf_key should be the bare content hash, so re-extracting a resume after an
+        extractor or taxonomy change replaces its row. Pass the extracted skills and education to
+        index them instead of data's, which carry profile_from_fields' placeholders when none were found.
+        """
+        payload = dumps_json(data.to_dict()).decode("utf-8")
+        skills = data.skills if skills is None else skills
+        education = data.education if education is None else education
+        with self._lock, self._conn:
+            if pdf_key is not None:
+                # Also drops rows keyed by a full cache_key, as stores written before bare hashes were
+                self._conn.execute("DELETE FROM profiles WHERE pdf_key = ? OR pdf_key LIKE ?",
+                                   (pdf_key, f"{pdf_key}-v%"))
+            cur = self._conn.execute(
+                "INSERT INTO profiles(pdf_key, name, email, phone, linkedin, github, path, data, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (pdf_key, data.name, data.email, data.phone, data.linkedin, data.github,
+                 path, payload, time.time()))
+            profile_id = cur.lastrowid
+            skill_ids = self._intern("skills", dict.fromkeys(skills))
+            self._conn.executemany("INSERT OR IGNORE INTO profile_skills(skill_id, profile_id) VALUES (?, ?)",
+                                   [(s, profile_id) for s in skill_ids])
+            edu_ids = self._intern("education", dict.fromkeys(education))
+            self._conn.executemany("INSERT OR IGNORE INTO profile_education(education_id, profile_id, position) VALUES (?, ?, ?)",
+                                   [(e, profile_id, i) for i, e in enumerate(edu_ids)])
+        return profile_id
+
+    def get(self, profile_id):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM profiles WHERE id = ?", (profile_id,)).fetchone()
+        return Profile.from_dict(loads_json(row[0])) if row else None
+
+    def find(self, skills=(), education=None, limit=None):
+        """
+        Profiles that have every skill in `skills` (case-insensitive) and, if given, an education
+        entry containing `education`. Returns summary dicts ordered by name.
+        """
+        # Casefolded first: names compare NOCASE, so "PyTorch" and "pytorch" are one required skill
+        skills = list(dict.fromkeys(s.casefold() for s in skills))
+        where, params = [], []
+        if skills:
+            marks = ", ".join("?" * len(skills))
+            where.append(f"""p.id IN (
+                SELECT ps.profile_id FROM profile_skills ps JOIN skills s ON s.id = ps.skill_id
+                WHERE s.name IN ({marks}) GROUP BY ps.profile_id HAVING COUNT(*) = ?)""")
+            params += skills + [len(skills)]
+        if education:
+            where.append("""p.id IN (
+                SELECT pe.profile_id FROM profile_education pe JOIN education e ON e.id = pe.education_id
+                WHERE e.name LIKE ?)""")
+            params.append(f"%{education}%")
+        sql = "SELECT p.id, p.name, p.email, p.github, p.path FROM profiles p"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY p.name COLLATE NOCASE"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            results = [{"id": r[0], "name": r[1], "email": r[2], "github": r[3], "path": r[4],
+                        "skills": self._skills_of(r[0])} for r in rows]
+        return results
+
+    def _skills_of(self, profile_id):
+        return [r[0] for r in self._conn.execute(
+            "SELECT s.name FROM profile_skills ps JOIN skills s ON s.id = ps.skill_id "
+            "WHERE ps.profile_id = ? ORDER BY s.name", (profile_id,))]
+
+    def skill_counts(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT s.name, COUNT(*) FROM profile_skills ps JOIN skills s ON s.id = ps.skill_id "
+                "GROUP BY s.id ORDER BY COUNT(*) DESC, s.name").fetchall()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def cohort_html(self, title="Candidate Cohort", profiles=None):
+        profiles = self.find() if profiles is None else profiles
+        return get_template("cohort.html").render(title=title, profiles=profiles, skill_counts=self.skill_counts()[:30])
+
+    def render_cohort(self, output_path, title="Candidate Cohort", profiles=None):
+        """
+        Writes a cohort index page linking every profile's own index.html (paths relative to output_path).
+        """
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(self.cohort_html(title, profiles))
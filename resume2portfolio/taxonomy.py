@@ -0,0 +1,139 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from dataclasses import dataclass
+
+from .model import _SLOTS
+
+TAXONOMY_PATH = os.environ.get("R2P_SKILL_TAXONOMY",
+                               os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.txt"))
+
+# ---------- Skill Taxonomy ----------
+# Skill tokens keep "+", "#" and inner dots (c++, c#, node.js); anything else, including "-" and "/", separates
+# words, so "scikit-learn" and "CI/CD" become phrases and a word never matches inside a longer one.
+TOKEN_RE = re.compile(r"[a-z0-9.+#]*[a-z0-9+#]")
+COMMENT_RE = re.compile(r"(?:^|\s)#.*")  # "#" after a word is part of it, as in C#
+
+def skill_tokens(text):
+    return TOKEN_RE.findall(text.lower())
+
+@dataclass(frozen=True, **_SLOTS)
+class Skill:
+    name: str
+    aliases: tuple = ()
+    weight: float = 1.0
+
+def _parse_line(line):
+    # Name | alias, alias | weight   (aliases and weight are optional)
+    parts = [p.strip() for p in line.split("|")]
+    aliases = tuple(a.strip() for a in parts[1].split(",") if a.strip()) if len(parts) > 1 else ()
+    weight = float(parts[2]) if len(parts) > 2 and parts[2] else 1.0
+    return Skill(parts[0], aliases, weight)
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """
+    Reads a taxonomy file: either text with one "Name | alias, alias | weight" entry per line
+    (a # at the start of a word begins a comment), or JSON mapping each name to a list of aliases or {"aliases": [...], "weight": w}.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            skills = []
+            for name, spec in json.load(f).items():
+                if isinstance(spec, dict):
+                    skills.append(Skill(name, tuple(spec.get("aliases", ())), float(spec.get("weight", 1.0))))
+                else:
+                    skills.append(Skill(name, tuple(spec)))
+            return skills
+        return [_parse_line(l) for l in (COMMENT_RE.sub("", l).strip() for l in f) if l]
+
+def taxonomy_version(path=TAXONOMY_PATH):
+    # Part of the extraction cache key: editing the taxonomy invalidates cached skills.
+    st = os.stat(path)
+    return hashlib.sha256(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()[:12]
+
+class SkillTaxonomy:
+    """
+    Compiled matcher for a skill taxonomy. Every name and alias is folded to a token tuple in one
+    hash table, and a resume is scanned token by token trying the longest phrase first, so matching
+    costs O(tokens x longest phrase) whatever the number of skills.
+    """
+    def __init__(self, skills):
+        import numpy as np  # deferred until the taxonomy is first used
+
+        self.names = []
+        self.phrases = {}
+        weights = []
+        for skill in skills:
+            skill_id = len(self.names)
+            self.names.append(skill.name)
+            weights.append(skill.weight)
+            for alias in (skill.name,) + skill.aliases:
+                # The first skill to claim a phrase keeps it
+                self.phrases.setdefault(tuple(skill_tokens(alias)), skill_id)
+        self.phrases.pop((), None)
+        self.weights = np.array(weights, dtype=np.float32)
+        self.starts = {p[0] for p in self.phrases}
+        self.longest = max(map(len, self.phrases), default=0)
+
+    @classmethod
+    def from_file(cls, path=TAXONOMY_PATH):
+        return cls(load_taxonomy(path))
+
+    def __len__(self):
+        return len(self.names)
+
+    def match(self, text):
+        """
+        Skill ids in order of occurrence, one per mention, preferring the longest phrase at each position.
+        """
+        tokens = skill_tokens(text)
+        phrases, starts = self.phrases, self.starts
+        ids = []
+        i, n = 0, len(tokens)
+        while i < n:
+            if tokens[i] in starts:
+                for size in range(min(self.longest, n - i), 0, -1):
+                    skill_id = phrases.get(tuple(tokens[i:i + size]))
+                    if skill_id is not None:
+                        ids.append(skill_id)
+                        i += size
+                        break
+                else:
+                    i += 1
+            else:
+                i += 1
+        return ids
+
+    def scores(self, text):
+        """
+        Returns [(name, score)] for every skill mentioned, best first. A skill scores its taxonomy
+        weight times (1 + log mentions); ties go to the skill mentioned first.
+        """
+        import numpy as np
+
+        ids = self.match(text)
+        if not ids:
+            return []
+        found, first, counts = np.unique(np.array(ids, dtype=np.int32), return_index=True, return_counts=True)
+        scores = self.weights[found] * (1 + np.log(counts))
+        order = np.lexsort((first, -scores))
+        return [(self.names[found[i]], round(float(scores[i]), 4)) for i in order]
+
+    def rank(self, text):
+        return [name for name, _ in self.scores(text)]
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+def get_taxonomy():
+    """
+    Returns the process-wide SkillTaxonomy compiled from TAXONOMY_PATH (R2P_SKILL_TAXONOMY).
+    """
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _taxonomy = SkillTaxonomy.from_file()
+    return _taxonomy
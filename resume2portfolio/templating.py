@@ -0,0 +1,44 @@
+import os
+import hashlib
+import tempfile
+import threading
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+BYTECODE_CACHE_DIR = os.environ.get("R2P_TEMPLATE_CACHE", os.path.join(tempfile.gettempdir(), "resume2portfolio-jinja"))
+
+# ---------- Shared Template Engine ----------
+_env = None
+_env_lock = threading.Lock()
+
+def get_env():
+    """
+    Returns the process-wide Jinja2 environment. Compiled templates are kept in memory and their
+    bytecode on disk, so a cold worker loads them without re-parsing the template source.
+    """
+    global _env
+    if _env is None:
+        with _env_lock:
+            if _env is None:
+                from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+                os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+                _env = Environment(loader=FileSystemLoader(TEMPLATE_DIR),
+                                   bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR),
+                                   cache_size=-1)
+    return _env
+
+def get_template(name="index.html"):
+    return get_env().get_template(name)
+
+def template_digest(template):
+    # Path + mtime identifies the template version without re-reading its source on every build.
+    st = os.stat(template.filename)
+    return hashlib.sha256(f"{template.filename}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()
+
+def warm_templates():
+    """
+    Compiles every template up front (call at startup / in worker initialisers).
+    """
+    env = get_env()
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
@@ -0,0 +1,18 @@
+import pytest
+
+from resume2portfolio.layout import Line
+
+@pytest.fixture
+def styled_resume():
+    # Caps headings at body size, bold project titles, regular body text.
+    return [
+        Line("Jane Doe", 20, True),
+        Line("jane@example.com", 11),
+        Line("PROJECTS", 11, True),
+        Line("Inventory Management Project", 11, True),
+        Line("Built a stock tracker with Flask and SQLite.", 11),
+        Line("Weather Dashboard", 11, True),
+        Line("Displays forecasts using React and a REST API.", 11),
+        Line("EDUCATION", 11, True),
+        Line("B.Tech in Computer Engineering, Pune University", 11),
+    ]
@@ -0,0 +1,36 @@
+from resume2portfolio.extract import _projects, extract_fields, split_lines
+from resume2portfolio.layout import segment, lines_text
+
+def test_projects_from_bold_titles(styled_resume):
+    lines = styled_resume
+    projects = _projects(segment(lines), split_lines(lines_text(lines)))
+    assert [(p["name"], p["desc"]) for p in projects] == [
+        ("Inventory Management Project", "Built a stock tracker with Flask and SQLite."),
+        ("Weather Dashboard", "Displays forecasts using React and a REST API."),
+    ]
+
+def test_projects_from_plain_text_with_tech_lines():
+    text = ("Jane Doe\nProjects\nCapstone Project\n• A capstone built with Django.\nTech: Django, PostgreSQL\n"
+            "Weather Dashboard\n• Displays forecasts.\nEducation\nBachelor of Science")
+    projects = extract_fields(text)["projects"]
+    assert [(p["name"], p["tech"]) for p in projects] == [("Capstone Project", "Django, PostgreSQL"),
+                                                          ("Weather Dashboard", "")]
+    assert projects[0]["desc"] == "A capstone built with Django."
+
+def test_projects_without_heading_fall_back_to_window():
+    text = "Jane Doe\nI enjoy project work.\nWeather Dashboard\nInventory Tracker"
+    assert [p["name"] for p in extract_fields(text)["projects"]] == ["Weather Dashboard", "Inventory Tracker"]
+
+def test_pdf_with_bold_project_titles():
+    import fitz
+    from resume2portfolio.extract import extract_pdf_lines
+
+    doc = fitz.open()
+    page = doc.new_page()
+    for y, (text, bold) in enumerate([("Jane Doe", True), ("PROJECTS", True), ("Inventory Management Project", True),
+                                      ("Built a stock tracker.", False), ("Weather Dashboard", True),
+                                      ("Displays forecasts.", False)]):
+        page.insert_text((50, 60 + 18 * y), text, fontname="hebo" if bold else "helv", fontsize=11)
+    lines = extract_pdf_lines(doc.tobytes())
+    fields = extract_fields(lines_text(lines), segment(lines))
+    assert [p["name"] for p in fields["projects"]] == ["Inventory Management Project", "Weather Dashboard"]
@@ -0,0 +1,41 @@
+from resume2portfolio.layout import Line, segment, section_kind, sections_of, text_lines
+
+def _kinds(sections):
+    return [(s.kind, s.heading.text if s.heading else None) for s in sections]
+
+def test_section_kind_matches_whole_headings():
+    assert section_kind("Projects") == "projects"
+    assert section_kind("Academic Projects:") == "projects"
+    assert section_kind("TECHNICAL SKILLS") == "skills"
+    assert section_kind("Honors & Awards") == "certifications"
+    assert section_kind("Work Experience") == "experience"
+
+def test_section_kind_ignores_titles_containing_keywords():
+    assert section_kind("Inventory Management Project") is None
+    assert section_kind("Capstone Project") is None
+    assert section_kind("Hackathon Award") is None
+    assert section_kind("Built a tool.") is None
+
+def test_bold_titles_stay_inside_their_section(styled_resume):
+    sections = segment(styled_resume)
+    assert _kinds(sections) == [("header", None), ("projects", "PROJECTS"), ("education", "EDUCATION")]
+    assert [l.text for l in sections_of(sections, "projects")][::2] == ["Inventory Management Project",
+                                                                         "Weather Dashboard"]
+
+def test_larger_headings_open_sections():
+    lines = [Line("Jane Doe", 20), Line("Skills", 14), Line("Python, SQL", 11),
+             Line("Experience", 14), Line("Data analyst at Acme.", 11)]
+    assert [s.kind for s in segment(lines)] == ["header", "skills", "experience"]
+
+def test_unrecognised_heading_in_heading_style_opens_other_section():
+    lines = [Line("Jane Doe", 20), Line("Skills", 14), Line("Python", 11),
+             Line("Volunteering", 14), Line("Food bank organiser.", 11)]
+    assert _kinds(segment(lines))[-1] == ("other", "Volunteering")
+
+def test_plain_text_short_titles_are_not_headings():
+    text = ("Jane Doe\nProjects\nCapstone Project\nA capstone built with Django.\n"
+            "Hackathon Award\nCertifications\nAWS Certified")
+    sections = segment(text_lines(text))
+    assert [s.kind for s in sections] == ["header", "projects", "certifications"]
+    assert [l.text for l in sections_of(sections, "projects")] == ["Capstone Project", "A capstone built with Django.",
+                                                                   "Hackathon Award"]
@@ -0,0 +1,35 @@
+from resume2portfolio.cache import content_digest
+from resume2portfolio.portfolio import pick_theme, profile_from_fields
+from resume2portfolio.store import ProfileStore
+
+def _fields(name, skills=(), education=()):
+    return {"name": name, "email": "", "phone": "", "linkedin": "", "github": "", "skills": list(skills),
+            "projects": [], "education": list(education), "certifications": []}
+
+def _add(store, fields, key):
+    data = profile_from_fields(fields, "Engineer", pick_theme("Random (Auto)"))
+    return store.add(data, pdf_key=key, skills=fields["skills"], education=fields["education"])
+
+def test_placeholders_are_not_indexed():
+    store = ProfileStore()
+    _add(store, _fields("Blank"), "a" * 64)
+    assert store.find(["Python"]) == []
+    assert store.find(education="University") == []
+    assert len(store) == 1
+
+def test_find_casefolds_skills():
+    store = ProfileStore()
+    _add(store, _fields("Jane", ["PyTorch", "SQL"]), "b" * 64)
+    assert [p["name"] for p in store.find(["PyTorch", "pytorch"])] == ["Jane"]
+    assert [p["name"] for p in store.find(["pytorch", "sql"])] == ["Jane"]
+
+def test_reextraction_replaces_profile():
+    store = ProfileStore()
+    digest = "c" * 64
+    store.add(profile_from_fields(_fields("Old", ["Java"]), "Engineer", pick_theme("Random (Auto)")),
+              pdf_key=f"{digest}-v4-0123456789ab")  # full cache_key, as older stores have
+    _add(store, _fields("Jane", ["Rust"]), content_digest(f"{digest}-v5-ba9876543210"))
+    _add(store, _fields("Jane", ["Rust", "Go"]), digest)
+    assert len(store) == 1
+    assert store.find(["Java"]) == []
+    assert store.find(["Rust", "Go"])[0]["skills"] == ["Go", "Rust"]